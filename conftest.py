@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+LinguaLint - AI-powered project planning and analysis platform
+Copyright (C) 2026 Jefferson Richards
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Shared pytest fixtures for the LinguaLint test suite
+"""
+
+import pytest
+
+@pytest.fixture(scope="session")
+def nlp_processor():
+    """One NLP processor, and spaCy pipeline load, for the whole test session"""
+    from src.nlp_processor import ModernNLPProcessor
+    return ModernNLPProcessor()
@@ -21,25 +21,35 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Simple CLI runner for LinguaLint processing with Responsibility Futures Analysis
 """
 
+import os
 import sys
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
 from src.nlp_processor import ModernNLPProcessor
+from src.json_writer import write_json
 from src.report_generator import generate_html_report
 from src.responsibility_analyzer import analyze_responsibility
 from src.responsibility_report_generator import generate_responsibility_reports
-from src.pdf_generator import generate_comprehensive_pdf
+from src.pdf_generator import ChromeSession, generate_comprehensive_pdf
 
 def main():
     if len(sys.argv) < 2:
         print("Usage: python run.py 'Your text here'")
         print("   or: python run.py --file input.txt")
+        print("   or: python run.py --dir input_directory")
         return 1
     
     # Initialize processor
     processor = ModernNLPProcessor()
     
+    # Batch mode: every .txt file in a directory
+    if sys.argv[1] == '--dir':
+        if len(sys.argv) < 3:
+            print("Error: Please specify input directory")
+            return 1
+        return process_directory(processor, Path(sys.argv[2]))
+    
     # Get input text
     if sys.argv[1] == '--file':
         if len(sys.argv) < 3:
@@ -56,7 +66,38 @@ def main():
     
     # Generate output files
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generate_outputs(results, timestamp)
+    
+    return 0
+
+def process_directory(processor: ModernNLPProcessor, input_dir: Path) -> int:
+    """Process every .txt file in a directory as one batch across CPU cores"""
+    input_files = sorted(input_dir.glob("*.txt"))
+    if not input_files:
+        print(f"Error: No .txt files found in {input_dir}")
+        return 1
+    
+    texts = [path.read_text(encoding='utf-8') for path in input_files]
     
+    print(f"Processing {len(texts)} documents...")
+    all_results = processor.process_texts(texts, enrich_wikipedia=True, n_process=min(os.cpu_count() or 1, len(texts)))
+    
+    # One analysis folder per document, numbered within this run's timestamp;
+    # if Chrome renders the PDFs, one browser is shared by the whole batch
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    with ChromeSession() as chrome_session:
+        for index, (path, results) in enumerate(zip(input_files, all_results), 1):
+            doc_timestamp = f"{timestamp}_{index:03d}"
+            print(f"\n📄 {path.name} -> analysis_{doc_timestamp}")
+            generate_outputs(results, doc_timestamp, chrome_session, parallel=True)
+    
+    return 0
+
+def generate_outputs(results, timestamp: str, chrome_session: ChromeSession = None, parallel: bool = False) -> None:
+    """
+    Write JSON, HTML, responsibility and PDF reports for one processed document;
+    parallel renders the responsibility plots in separate processes
+    """
     # Create lingualint_analysis directory structure
     analysis_base_dir = Path("./lingualint_analysis")
     analysis_base_dir.mkdir(exist_ok=True)
@@ -69,8 +110,7 @@ def main():
     html_file = analysis_dir / f"report_{timestamp}.html"
     
     # Save JSON
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    write_json(json_file, results)
     
     # Generate HTML report
     generate_html_report(str(json_file), str(html_file))
@@ -84,17 +124,16 @@ def main():
     try:
         # Step 1: Analyze responsibility from extraction data
         print("Step 1: Analyzing entity responsibility ratios...")
-        responsibility_report = analyze_responsibility(str(json_file))
+        responsibility_report = analyze_responsibility(results)
         
         # Step 2: Save responsibility analysis JSON
         responsibility_json = json_file.with_name(f"extraction_{timestamp}_responsibility_analysis.json")
-        with open(responsibility_json, 'w', encoding='utf-8') as f:
-            json.dump(responsibility_report, f, indent=2, ensure_ascii=False)
+        responsibility_json.write_bytes(orjson.dumps(responsibility_report, option=orjson.OPT_INDENT_2))
         print(f"✅ Responsibility analysis JSON saved: {responsibility_json.name}")
         
         # Step 3: Generate responsibility visualizations and HTML report
         print("Step 2: Generating responsibility visualizations...")
-        responsibility_files = generate_responsibility_reports(str(responsibility_json))
+        responsibility_files = generate_responsibility_reports(str(responsibility_json), parallel=parallel)
         
         # Step 4: Report results
         print(f"\n🎉 RESPONSIBILITY ANALYSIS COMPLETE!")
@@ -113,7 +152,7 @@ def main():
         
     except ImportError as e:
         print(f"⚠️  Missing dependencies for responsibility analysis: {e}")
-        print("💡 Install with: pip install matplotlib seaborn pandas numpy")
+        print("💡 Install with: pip install matplotlib seaborn numpy")
         print("📝 Responsibility analysis skipped, but extraction completed successfully.")
         
     except Exception as e:
@@ -157,7 +196,7 @@ def main():
     print("="*60)
     
     try:
-        pdf_file = generate_comprehensive_pdf(timestamp, analysis_dir)
+        pdf_file = generate_comprehensive_pdf(timestamp, analysis_dir, chrome_session)
         
         if pdf_file:
             print(f"🎉 COMPREHENSIVE PDF GENERATED!")
@@ -174,8 +213,6 @@ def main():
         import traceback
         print("🔍 Debug info:")
         traceback.print_exc()
-    
-    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
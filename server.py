@@ -24,7 +24,7 @@ Model Context Protocol server that exposes LinguaLint risk factor extraction
 as tools for MCP clients. Uses FastMCP for simple server implementation.
 """
 
-import json
+import orjson
 import tempfile
 import smtplib
 from pathlib import Path
@@ -34,6 +34,7 @@ from email.mime.multipart import MIMEMultipart
 
 from mcp.server.fastmcp import FastMCP
 from src.nlp_processor import ModernNLPProcessor
+from src.json_writer import write_json
 from src.report_generator import generate_html_report
 from src.responsibility_analyzer import analyze_responsibility
 from src.responsibility_report_generator import generate_responsibility_reports
@@ -42,20 +43,28 @@ from src.pdf_generator import generate_comprehensive_pdf
 # Initialize MCP server
 mcp = FastMCP("LinguaLint Event Code Extractor")
 
-# Global processor instance
-processor = ModernNLPProcessor()
+# Global processor instance, created on first use so startup doesn't block on spacy.load
+_processor = None
+
+def get_processor() -> ModernNLPProcessor:
+    """Return the shared NLP processor, loading the SpaCy model on first call"""
+    global _processor
+    if _processor is None:
+        _processor = ModernNLPProcessor()
+    return _processor
 
 # Output directory for analysis
 ANALYSIS_BASE_DIR = Path("./lingualint_analysis")
 ANALYSIS_BASE_DIR.mkdir(exist_ok=True)
 
 @mcp.tool()
-def extract_risk_factors(text_content: str) -> str:
+def extract_risk_factors(text_content: str, pretty_json: bool = False) -> str:
     """
     Extract risk factors and generate interactive D3.js report from text content.
     
     Args:
         text_content: Input text to analyze for risk factors
+        pretty_json: Indent the saved JSON files for human reading (compact by default)
         
     Returns:
         Summary of extraction results and path to generated HTML report
@@ -66,7 +75,7 @@ def extract_risk_factors(text_content: str) -> str:
 
     try:
         # Process text through NLP pipeline
-        results = processor.process_text(text_content, enrich_wikipedia=True)
+        results = get_processor().process_text(text_content, enrich_wikipedia=True)
         
         # Generate unique filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -79,8 +88,7 @@ def extract_risk_factors(text_content: str) -> str:
         html_file = analysis_dir / f"report_{timestamp}.html"
         
         # Save JSON results
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        write_json(json_file, results, indent=pretty_json)
         
         # Generate HTML report
         generate_html_report(str(json_file), str(html_file))
@@ -89,12 +97,12 @@ def extract_risk_factors(text_content: str) -> str:
         responsibility_summary = ""
         try:
             # Analyze responsibility
-            responsibility_report = analyze_responsibility(str(json_file))
+            responsibility_report = analyze_responsibility(results)
             
             # Save responsibility analysis JSON
             responsibility_json = json_file.with_name(f"extraction_{timestamp}_responsibility_analysis.json")
-            with open(responsibility_json, 'w', encoding='utf-8') as f:
-                json.dump(responsibility_report, f, indent=2, ensure_ascii=False)
+            json_option = orjson.OPT_INDENT_2 if pretty_json else 0
+            responsibility_json.write_bytes(orjson.dumps(responsibility_report, option=json_option))
             
             # Generate responsibility visualizations and HTML report
             responsibility_files = generate_responsibility_reports(str(responsibility_json))
@@ -123,9 +131,10 @@ def extract_risk_factors(text_content: str) -> str:
             pdf_summary = f"\n- Comprehensive PDF: FAILED ({str(e)})"
         
         # Create summary
-        sentences_count = len(results.get('_source', {}).get('sentences', []))
-        phen_count = len(results.get('_source', {}).get('phen', []))
-        wiki_count = len(results.get('_source', {}).get('wiki', []))
+        source = results.get('_source') or {}
+        sentences_count = len(source.get('sentences', ()))
+        phen_count = len(source.get('phen', ()))
+        wiki_count = len(source.get('wiki', ()))
         
         summary = f"""Risk Factor Extraction Complete:
 - Processed {sentences_count} sentences
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+LinguaLint - AI-powered project planning and analysis platform
+Copyright (C) 2026 Jefferson Richards
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+JSON file helpers for LinguaLint outputs
+
+write_json serializes a document with orjson in one call and writes the
+bytes in one call; read_json parses those files back, also with orjson.
+"""
+
+import json
+import orjson
+from pathlib import Path
+from typing import Any, Dict, Union
+
+def write_json(path: Union[str, Path], obj: Dict[str, Any], indent: bool = True) -> None:
+    """Write a dict as JSON with orjson, indented by two spaces unless indent is False"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+
+def read_json(json_bytes: bytes) -> Any:
+    """Parse JSON bytes with orjson; json.dump output with NaN/Infinity falls back to the json module"""
+    try:
+        return orjson.loads(json_bytes)
+    except orjson.JSONDecodeError:
+        return json.loads(json_bytes)
@@ -23,17 +23,51 @@ Replaces legacy Java/Talend extraction logic
 """
 
 import spacy
+import numpy as np
+from spacy.attrs import LOWER, IS_ALPHA
+from spacy.matcher import PhraseMatcher
+import re
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
-import hashlib
-import time
+from typing import List, Dict, Any, Tuple, NamedTuple
+import uuid
 from .wikipedia_enricher import integrate_wikipedia_sync
 
+# Word lists behind the warm/cold sentiment vectors
+POSITIVE_WORDS = frozenset({'good', 'strong', 'growth', 'increase', 'positive', 'benefit', 'advantage'})
+NEGATIVE_WORDS = frozenset({'risk', 'adverse', 'decrease', 'decline', 'negative', 'loss', 'threat', 'danger'})
+ENGAGEMENT_WORDS = frozenset({'will', 'can', 'may', 'could'})
+RISK_WORDS = frozenset({'risk', 'may', 'could', 'might'})
+
+# Entity labels and POS tags consulted by the extraction helpers
+SUBJECT_ENT_LABELS = frozenset({'PERSON', 'ORG', 'GPE', 'PRODUCT', 'EVENT', 'LAW', 'MONEY'})
+PHRASE_POS = frozenset({'VERB', 'ADJ'})
+WINDOW_SKIP_POS = frozenset({'PUNCT', 'SPACE'})
+PHRASE_SKIP_POS = frozenset({'PUNCT', 'SPACE', 'DET'})
+
+RELATIONAL_PRIMES = frozenset({
+    'because', 'if', 'when', 'where', 'do', 'happen', 'move', 
+    'say', 'think', 'feel', 'see', 'hear', 'like', 'can'
+})
+
+# Terms that make an entity likely to have a Wikipedia page
+WIKI_PRIORITY_TERMS = (
+    'company', 'corporation', 'inc', 'llc', 'pandemic', 'covid', 'crisis',
+    'technology', 'system', 'market', 'industry', 'regulation', 'government',
+    'economic', 'financial', 'business', 'operations', 'revenue', 'debt'
+)
+WIKI_PRIORITY_RE = re.compile('|'.join(map(re.escape, WIKI_PRIORITY_TERMS)))
+
+class SentArrays(NamedTuple):
+    """Per-sentence token attributes, extracted once and shared by the helpers"""
+    texts: List[str]
+    pos: List[str]
+
 class ModernNLPProcessor:
     def __init__(self):
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Lemmas are never read; attribute_ruler stays since it maps tags to token.pos_
+            self.nlp = spacy.load("en_core_web_sm", exclude=["lemmatizer"])
         except OSError:
             raise RuntimeError("Please install: python -m spacy download en_core_web_sm")
         
@@ -73,27 +107,58 @@ class ModernNLPProcessor:
             'LIKE'
         }
         
-        # Convert to lowercase for matching
-        self.prime_words = [prime.lower().split() for prime in self.semantic_primes]
-        self.prime_singles = {word for prime in self.prime_words for word in prime if len(prime) == 1}
-        self.prime_phrases = {' '.join(prime): prime for prime in self.prime_words if len(prime) > 1}
+        # Case-insensitive matcher over the tokenized primes; each prime is its own match key
+        self.prime_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for prime in self.semantic_primes:
+            prime_text = prime.lower()
+            self.prime_matcher.add(prime_text, [self.nlp.make_doc(prime_text)])
+        
+        # Sorted lowercase-form hashes of every sentiment word, compared against Doc.to_array(LOWER),
+        # plus a membership matrix whose columns are (positive, negative, engagement, risk)
+        sentiment_sets = (POSITIVE_WORDS, NEGATIVE_WORDS, ENGAGEMENT_WORDS, RISK_WORDS)
+        hashed_words = sorted(
+            (self.nlp.vocab.strings.add(word), word) for word in frozenset().union(*sentiment_sets)
+        )
+        self.sentiment_hashes = np.array([h for h, _ in hashed_words], dtype=np.uint64)
+        self.sentiment_membership = np.array(
+            [[word in words for words in sentiment_sets] for _, word in hashed_words], dtype=np.int64
+        )
 
     def process_text(self, text: str, tag: str = "", email: str = "", enrich_wikipedia: bool = True) -> Dict[str, Any]:
         """Process text using modern NLP techniques"""
-        doc = self.nlp(text)
-        sentences = list(doc.sents)
-        
+        return self.process_texts([text], tag=tag, email=email, enrich_wikipedia=enrich_wikipedia)[0]
+
+    def process_texts(self, texts: List[str], tag: str = "", email: str = "", enrich_wikipedia: bool = True,
+                      batch_size: int = 32, n_process: int = 1) -> List[Dict[str, Any]]:
+        """Process multiple texts, batching them through the SpaCy pipeline
+        
+        n_process > 1 parses documents in SpaCy worker processes; extraction
+        and Wikipedia enrichment still run in the calling process.
+        """
+        return [
+            self._process_doc(doc, tag, email, enrich_wikipedia)
+            for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        ]
+
+    def _process_doc(self, doc, tag: str, email: str, enrich_wikipedia: bool) -> Dict[str, Any]:
+        """Build the legacy-compatible result for a parsed SpaCy Doc"""
         processed_sentences = []
-        all_subjects = []
-        all_concepts = []
-        all_relations = []
-        
-        for sent_idx, sent in enumerate(sentences):
-            sent_data = self._process_sentence(sent, sent_idx)
+        first_sentence = ""
+        all_subjects = set()
+        all_concepts = set()
+        all_relations = set()
+        
+        # LOWER/IS_ALPHA columns for the whole Doc, sliced per sentence for sentiment scoring
+        lower_alpha = doc.to_array([LOWER, IS_ALPHA])
+        
+        for sent_idx, sent in enumerate(doc.sents):
+            sent_data = self._process_sentence(sent, sent_idx, lower_alpha[sent.start:sent.end])
+            if sent_idx == 0:
+                first_sentence = sent_data['sentence_obj']['sentence']
             processed_sentences.append(sent_data['sentence_obj'])
-            all_subjects.extend(sent_data['subjects'])
-            all_concepts.extend(sent_data['concepts'])
-            all_relations.extend(sent_data['relations'])
+            all_subjects.update(sent_data['subjects'])
+            all_concepts.update(sent_data['concepts'])
+            all_relations.update(sent_data['relations'])
         
         # Create legacy-compatible output
         result = {
@@ -108,12 +173,12 @@ class ModernNLPProcessor:
                     "timestamp": datetime.now().isoformat(),
                     "tag": tag,
                     "email": email,
-                    "first_sentence": sentences[0].text.strip() if sentences else ""
+                    "first_sentence": first_sentence
                 },
                 "sentences": processed_sentences,
-                "subjects": list(set(all_subjects)),  # Separate subjects field
+                "subjects": list(all_subjects),  # Separate subjects field
                 "phen": self._extract_phenomena(all_subjects, all_concepts, all_relations),
-                "wiki_blues": self._extract_wiki_candidates(all_subjects + all_concepts),
+                "wiki_blues": self._extract_wiki_candidates([*all_subjects, *all_concepts]),
                 "wiki": []  # Will be populated by Wikipedia integration
             }
         }
@@ -127,14 +192,15 @@ class ModernNLPProcessor:
         
         return result
 
-    def _process_sentence(self, sent, sent_idx: int) -> Dict[str, Any]:
+    def _process_sentence(self, sent, sent_idx: int, lower_alpha: np.ndarray) -> Dict[str, Any]:
         """Process individual sentence with SpaCy NLP"""
-        subjects = self._extract_subjects(sent)
-        concepts, relations = self._extract_concepts_and_relations(sent)
+        arrays = self._sentence_arrays(sent)
+        subjects = self._extract_subjects(sent, arrays)
+        concepts, relations = self._extract_concepts_and_relations(sent, arrays)
         
         # Calculate basic sentiment vectors (placeholder implementation)
-        warm_vector = self._calculate_sentiment_vector(sent, 'warm')
-        cold_vector = self._calculate_sentiment_vector(sent, 'cold')
+        alpha_words = lower_alpha[lower_alpha[:, 1] == 1, 0]
+        warm_vector, cold_vector = self._calculate_sentiment_vectors(alpha_words)
         
         return {
             'sentence_obj': {
@@ -147,46 +213,51 @@ class ModernNLPProcessor:
             'relations': relations
         }
 
-    def _extract_subjects(self, sent) -> List[str]:
+    def _sentence_arrays(self, sent) -> SentArrays:
+        """Read token text/POS/alpha flags once per sentence"""
+        return SentArrays(
+            texts=[token.text for token in sent],
+            pos=[token.pos_ for token in sent]
+        )
+
+    def _extract_subjects(self, sent, arrays: SentArrays) -> List[str]:
         """Extract core subjects - proper nouns, organizations, key entities"""
-        subjects = []
+        subjects = set()
         
         # Use Named Entity Recognition for core subjects
+        ent_texts = set()
         for ent in sent.ents:
-            if ent.label_ in ['PERSON', 'ORG', 'GPE', 'PRODUCT', 'EVENT', 'LAW', 'MONEY']:
-                subjects.append(ent.text)
+            ent_texts.add(ent.text)
+            if ent.label_ in SUBJECT_ENT_LABELS:
+                subjects.add(ent.text)
         
         # Extract proper nouns (capitalized) as core subjects
-        for token in sent:
-            if (token.pos_ == 'PROPN' and 
-                token.text[0].isupper() and
-                len(token.text) > 2 and
-                token.text not in [ent.text for ent in sent.ents]):
-                subjects.append(token.text)
+        for text, pos in zip(arrays.texts, arrays.pos):
+            if (pos == 'PROPN' and 
+                text[0].isupper() and
+                len(text) > 2 and
+                text not in ent_texts):
+                subjects.add(text)
         
         # Extract noun phrases that are capitalized (likely subjects)
         for chunk in sent.noun_chunks:
             if (chunk.text[0].isupper() and 
-                len(chunk.text.split()) <= 3 and
-                chunk.text not in subjects):
-                subjects.append(chunk.text)
+                len(chunk.text.split()) <= 3):
+                subjects.add(chunk.text)
         
-        return list(set(subjects))
+        return list(subjects)
 
-    def _extract_concepts_and_relations(self, sent) -> Tuple[List[str], List[str]]:
+    def _extract_concepts_and_relations(self, sent, arrays: SentArrays) -> Tuple[List[str], List[str]]:
         """Extract non-capitalized phenomena and relations using Semantic Primes"""
         concepts = []
         relations = []
         
-        sent_text = sent.text.lower()
-        tokens = [token for token in sent]
-        
         # Find semantic primes in the sentence
-        prime_positions = self._find_semantic_primes(tokens)
+        prime_positions = self._find_semantic_primes(sent)
         
         # Extract concepts around primes
         for prime_pos, prime_text in prime_positions:
-            concept_window = self._extract_concept_window(tokens, prime_pos, prime_text)
+            concept_window = self._extract_concept_window(arrays, prime_pos, prime_text)
             
             if self._is_relational_prime(prime_text):
                 relations.append(concept_window)
@@ -204,131 +275,107 @@ class ModernNLPProcessor:
                 concepts.append(chunk_text)
         
         # Extract verb phrases and descriptive phrases (non-capitalized)
-        for token in sent:
-            if token.pos_ in ['VERB', 'ADJ'] and not token.text[0].isupper():
+        for i, (text, pos) in enumerate(zip(arrays.texts, arrays.pos)):
+            if pos in PHRASE_POS and not text[0].isupper():
                 # Get surrounding context for meaningful phrases
-                phrase = self._get_phrase_context(token, sent)
+                phrase = self._get_phrase_context(sent.start + i, arrays)
                 if phrase and len(phrase) > 3 and not phrase[0].isupper():
                     concepts.append(phrase)
         
         return concepts, relations
 
-    def _find_semantic_primes(self, tokens) -> List[Tuple[int, str]]:
-        """Find Semantic Primes in token sequence"""
+    def _find_semantic_primes(self, sent) -> List[Tuple[int, str]]:
+        """Find Semantic Primes in a sentence (leftmost, longest match wins)"""
         primes_found = []
-        i = 0
+        next_free = sent.start
         
-        while i < len(tokens):
-            # Check for multi-word primes first
-            for phrase_len in range(min(4, len(tokens) - i), 0, -1):
-                phrase = ' '.join(token.text.lower() for token in tokens[i:i+phrase_len])
-                if phrase in self.prime_phrases:
-                    primes_found.append((i, phrase))
-                    i += phrase_len
-                    break
-            else:
-                # Check single word primes
-                if tokens[i].text.lower() in self.prime_singles:
-                    primes_found.append((i, tokens[i].text.lower()))
-                i += 1
+        # Matcher offsets are Doc-relative; report them relative to the sentence
+        matches = sorted((start, -end, match_id) for match_id, start, end in self.prime_matcher(sent))
+        for start, neg_end, match_id in matches:
+            if start >= next_free:
+                primes_found.append((start - sent.start, self.nlp.vocab.strings[match_id]))
+                next_free = -neg_end
         
         return primes_found
 
-    def _extract_concept_window(self, tokens, prime_pos: int, prime_text: str) -> str:
+    def _extract_concept_window(self, arrays: SentArrays, prime_pos: int, prime_text: str) -> str:
         """Extract concept window around semantic prime"""
         window_size = 3
         start = max(0, prime_pos - window_size)
-        end = min(len(tokens), prime_pos + window_size + 1)
-        
-        window_tokens = []
-        for i in range(start, end):
-            if i != prime_pos and tokens[i].pos_ not in ['PUNCT', 'SPACE']:
-                window_tokens.append(tokens[i].text)
+        end = min(len(arrays.texts), prime_pos + window_size + 1)
         
-        return ' '.join(window_tokens).strip()
+        return ' '.join(
+            text
+            for i, (text, pos) in enumerate(zip(arrays.texts[start:end], arrays.pos[start:end]), start)
+            if i != prime_pos and pos not in WINDOW_SKIP_POS
+        ).strip()
 
     def _is_relational_prime(self, prime_text: str) -> bool:
         """Determine if semantic prime indicates a relation"""
-        relational_primes = {
-            'because', 'if', 'when', 'where', 'do', 'happen', 'move', 
-            'say', 'think', 'feel', 'see', 'hear', 'like', 'can'
-        }
-        return prime_text in relational_primes
+        return prime_text in RELATIONAL_PRIMES
 
-    def _extract_phenomena(self, subjects: List[str], concepts: List[str], relations: List[str]) -> List[str]:
+    def _extract_phenomena(self, subjects, concepts, relations) -> List[str]:
         """Extract phenomena (key phrases) from all components"""
-        phenomena = []
+        phenomena = set()
         
-        # Add all subjects, concepts, and relations
-        phenomena.extend(subjects)
-        phenomena.extend(concepts)
-        phenomena.extend(relations)
+        # Add all subjects, concepts, and relations, cleaned and deduplicated
+        for items in (subjects, concepts, relations):
+            phenomena.update(p.strip() for p in items if p and len(p.strip()) > 2)
         
-        # Clean and deduplicate
-        phenomena = [p.strip() for p in phenomena if p and len(p.strip()) > 2]
-        return list(set(phenomena))
+        return list(phenomena)
 
-    def _get_phrase_context(self, token, sent) -> str:
-        """Get meaningful phrase context around a token"""
-        start_idx = max(0, token.i - 2)
-        end_idx = min(len(sent), token.i + 3)
-        
-        phrase_tokens = []
-        for i in range(start_idx, end_idx):
-            if sent[i].pos_ not in ['PUNCT', 'SPACE', 'DET'] and len(sent[i].text) > 1:
-                phrase_tokens.append(sent[i].text)
-        
-        return ' '.join(phrase_tokens).strip()
+    def _get_phrase_context(self, token_i: int, arrays: SentArrays) -> str:
+        """Get meaningful phrase context around a token (token_i is the Doc index)"""
+        start_idx = max(0, token_i - 2)
+        end_idx = min(len(arrays.texts), token_i + 3)
+        
+        return ' '.join(
+            text
+            for text, pos in zip(arrays.texts[start_idx:end_idx], arrays.pos[start_idx:end_idx])
+            if pos not in PHRASE_SKIP_POS and len(text) > 1
+        ).strip()
 
     def _extract_wiki_candidates(self, entities: List[str]) -> List[str]:
         """Extract candidates most likely to have Wikipedia entries"""
         candidates = []
         
-        # Prioritize entities that are likely to have Wikipedia pages
-        wiki_priority_terms = [
-            'company', 'corporation', 'inc', 'llc', 'pandemic', 'covid', 'crisis',
-            'technology', 'system', 'market', 'industry', 'regulation', 'government',
-            'economic', 'financial', 'business', 'operations', 'revenue', 'debt'
-        ]
-        
         for entity in entities:
-            entity_lower = entity.lower()
             # Include if it's a proper noun (capitalized) or contains wiki-priority terms
-            if (entity[0].isupper() or 
-                any(term in entity_lower for term in wiki_priority_terms) or
+            if entity and (entity[0].isupper() or 
+                WIKI_PRIORITY_RE.search(entity.lower()) or
                 len(entity.split()) >= 2):
                 candidates.append(entity)
         
-        # Remove duplicates and limit
-        return list(set(candidates))[:20]
+        # Remove duplicates (keeping first-seen order) and limit
+        return list(dict.fromkeys(candidates))[:20]
 
-    def _calculate_sentiment_vector(self, sent, vector_type: str) -> List[float]:
-        """Calculate sentiment vectors for warm/cold analysis"""
-        # Simple sentiment scoring based on word polarity
-        positive_words = {'good', 'strong', 'growth', 'increase', 'positive', 'benefit', 'advantage'}
-        negative_words = {'risk', 'adverse', 'decrease', 'decline', 'negative', 'loss', 'threat', 'danger'}
-        
-        words = [token.text.lower() for token in sent if token.is_alpha]
-        
-        pos_count = sum(1 for word in words if word in positive_words)
-        neg_count = sum(1 for word in words if word in negative_words)
-        total_words = len(words)
-        
-        if vector_type == 'warm':
-            # Warm vector: [positivity, engagement, optimism]
-            return [
-                pos_count / max(total_words, 1),
-                len([w for w in words if w in {'will', 'can', 'may', 'could'}]) / max(total_words, 1),
-                pos_count / max(pos_count + neg_count, 1)
-            ]
-        else:
-            # Cold vector: [negativity, risk, uncertainty]
-            return [
-                neg_count / max(total_words, 1),
-                len([w for w in words if w in {'risk', 'may', 'could', 'might'}]) / max(total_words, 1),
-                neg_count / max(pos_count + neg_count, 1)
-            ]
+    def _calculate_sentiment_vectors(self, words: np.ndarray) -> Tuple[List[float], List[float]]:
+        """Calculate warm and cold sentiment vectors in a single pass"""
+        # Simple sentiment scoring based on word polarity: look every word up in the
+        # sorted hash table once and sum the membership rows of the hits
+        idx = np.searchsorted(self.sentiment_hashes, words)
+        idx[idx == len(self.sentiment_hashes)] = 0
+        hits = idx[self.sentiment_hashes[idx] == words]
+        pos_count, neg_count, engagement_count, risk_count = (
+            int(count) for count in self.sentiment_membership[hits].sum(axis=0)
+        )
+        total_words = max(len(words), 1)
+        polar_words = max(pos_count + neg_count, 1)
+        
+        # Warm vector: [positivity, engagement, optimism]
+        warm_vector = [
+            pos_count / total_words,
+            engagement_count / total_words,
+            pos_count / polar_words
+        ]
+        # Cold vector: [negativity, risk, uncertainty]
+        cold_vector = [
+            neg_count / total_words,
+            risk_count / total_words,
+            neg_count / polar_words
+        ]
+        return warm_vector, cold_vector
 
     def _generate_id(self) -> str:
         """Generate unique document ID"""
-        return hashlib.md5(f"{time.time()}".encode()).hexdigest()[:20]
\ No newline at end of file
+        return uuid.uuid4().hex[:20]
\ No newline at end of file
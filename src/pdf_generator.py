@@ -25,133 +25,89 @@ stored in an appropriately named folder in the root directory.
 """
 
 import os
+import re
 import sys
 import json
+import time
+import base64
+import asyncio
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import subprocess
 import tempfile
 import shutil
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
-# Try to import PDF generation libraries
-try:
+# Probe for PDF generation libraries without importing them; they are only
+# loaded by the backend that actually renders the PDF
+PDF_WEASYPRINT_AVAILABLE = importlib.util.find_spec('weasyprint') is not None
+PDF_PDFKIT_AVAILABLE = importlib.util.find_spec('pdfkit') is not None
+
+# Chrome/Chromium executables for headless PDF printing, resolved once at import
+CHROME_COMMANDS = (
+    'google-chrome',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    '/usr/bin/google-chrome',
+    '/usr/bin/chromium'
+)
+CHROME_CMD = next((cmd for cmd in CHROME_COMMANDS if shutil.which(cmd) or Path(cmd).exists()), None)
+
+# Seconds Chrome gets to start, or to load and print one PDF
+CHROME_TIMEOUT = 30
+
+@lru_cache(maxsize=1)
+def _load_weasyprint():
     import weasyprint
-    PDF_WEASYPRINT_AVAILABLE = True
-except ImportError:
-    PDF_WEASYPRINT_AVAILABLE = False
+    return weasyprint
 
-try:
+@lru_cache(maxsize=1)
+def _load_pdfkit():
     import pdfkit
-    PDF_PDFKIT_AVAILABLE = True
-except ImportError:
-    PDF_PDFKIT_AVAILABLE = False
+    return pdfkit
 
-class LinguaLintPDFGenerator:
-    """
-    Generates comprehensive PDF reports from LinguaLint HTML outputs
-    """
-    
-    def __init__(self, timestamp: str, analysis_dir: Path = None):
-        self.timestamp = timestamp
-        self.analysis_dir = analysis_dir
-        self.root_dir = Path(".")
-        
-        if analysis_dir:
-            # Use provided analysis directory
-            self.output_dir = analysis_dir
-            print(f"📁 Using existing analysis directory: {self.output_dir}")
-        else:
-            # Create lingualint_analysis directory structure (legacy mode)
-            self.super_dir = self.root_dir / "lingualint_analysis"
-            self.super_dir.mkdir(exist_ok=True)
-            
-            # Create specific analysis folder within super folder
-            self.output_dir = self.super_dir / f"analysis_{timestamp}"
-            self.output_dir.mkdir(exist_ok=True)
-            
-            print(f"📁 PDF super directory: {self.super_dir}")
-            print(f"📁 Analysis output directory: {self.output_dir}")
-    
-    def find_html_reports(self) -> Dict[str, Optional[Path]]:
-        """Find all HTML reports for the given timestamp"""
-        reports = {
-            'main_report': None,
-            'responsibility_report': None,
-            'gantt_chart': None
-        }
-        
-        # Look for main report in the analysis directory
-        main_report = self.output_dir / f"report_{self.timestamp}.html"
-        if main_report.exists():
-            reports['main_report'] = main_report
-        
-        # Look for responsibility report in the analysis directory
-        responsibility_report = self.output_dir / f"responsibility_report_{self.timestamp}.html"
-        if responsibility_report.exists():
-            reports['responsibility_report'] = responsibility_report
-        
-        # Look for gantt chart in the analysis directory
-        gantt_chart = self.output_dir / f"gantt_chart_{self.timestamp}.html"
-        if gantt_chart.exists():
-            reports['gantt_chart'] = gantt_chart
-        
-        return reports
-    
-    def copy_assets_to_output(self) -> None:
-        """Assets are already in the output directory, so this is a no-op"""
-        print("📋 Assets already in analysis directory - no copying needed")
-        
-        # List existing assets
-        png_files = list(self.output_dir.glob(f"*{self.timestamp}*.png"))
-        json_files = list(self.output_dir.glob(f"*{self.timestamp}*.json"))
-        csv_files = list(self.output_dir.glob(f"*{self.timestamp}*.csv"))
-        
-        for png_file in png_files:
-            print(f"   📊 Found: {png_file.name}")
-        for json_file in json_files:
-            print(f"   📄 Found: {json_file.name}")
-        for csv_file in csv_files:
-            print(f"   📈 Found: {csv_file.name}")
-    
-    def create_combined_html(self, reports: Dict[str, Optional[Path]]) -> Path:
-        """Create a combined HTML document with all reports"""
-        print("📄 Creating combined HTML document...")
-        
-        combined_html = self.output_dir / f"combined_report_{self.timestamp}.html"
-        
-        # Read the main report to extract metadata
-        main_content = ""
-        responsibility_content = ""
-        gantt_content = ""
-        
-        if reports['main_report']:
-            with open(reports['main_report'], 'r', encoding='utf-8') as f:
-                main_content = f.read()
-        
-        if reports['responsibility_report']:
-            with open(reports['responsibility_report'], 'r', encoding='utf-8') as f:
-                responsibility_content = f.read()
-        
-        if reports['gantt_chart']:
-            with open(reports['gantt_chart'], 'r', encoding='utf-8') as f:
-                gantt_content = f.read()
-        
-        # Create combined HTML
-        combined_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LinguaLint Comprehensive Analysis Report - {self.timestamp}</title>
-    <style>
-        @page {{
+def _is_newer(path: Path, mtime: float) -> bool:
+    """Whether path exists and was modified after mtime"""
+    try:
+        return path.stat().st_mtime > mtime
+    except FileNotFoundError:
+        return False
+
+# Patterns used by _extract_body_content, compiled once at import
+BODY_RE = re.compile(r'<body[^>]*>(.*?)</body>', re.DOTALL | re.IGNORECASE)
+HEAD_END_RE = re.compile(r'</head>', re.IGNORECASE)
+BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# Every element the PDF cleanup removes or rewrites, matched in a single scan.
+# Branches are listed in the order the rewrites used to be applied, and the
+# (?i:...) groups keep the case-insensitive matching of the removal patterns.
+BODY_TAGS_RE = re.compile(
+    r'(?P<script>(?i:<script[^>]*>.*?</script>))'
+    r'|(?P<button>(?i:<button[^>]*>.*?</button>))'
+    r'|(?P<visualization_div>(?i:<div[^>]*id="visualization"[^>]*>.*?</div>))'
+    r'|(?P<table><table(?P<table_attrs>[^>]*?)>)'
+    r'|(?P<visualization_class><div[^>]*class="visualization"[^>]*>)'
+    r'|(?P<controls>(?i:<div[^>]*class="controls"[^>]*>.*?</div>))',
+    re.DOTALL
+)
+
+# Inline grid used by the main report for subjects, phenomena and Wikipedia cards
+CSS_GRID_DIV = '<div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 10px; margin: 20px 0;">'
+
+D3_REPLACEMENT_HTML = '<div class="d3-replacement"><p><strong>Interactive D3.js Visualization</strong><br/>This section contains an interactive network graph that is available in the HTML version of this report.</p></div>'
+
+# Stylesheet for the combined report, shared by every generator instance
+COMBINED_REPORT_CSS = """
+        @page {
             size: A4;
             margin: 0.75in;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.4;
             margin: 0;
@@ -159,9 +115,9 @@ class LinguaLintPDFGenerator:
             background: white;
             color: #333;
             font-size: 11pt;
-        }}
+        }
         
-        .cover-page {{
+        .cover-page {
             text-align: center;
             padding: 2in 0.5in;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -169,26 +125,26 @@ class LinguaLintPDFGenerator:
             margin-bottom: 0.5in;
             border-radius: 8px;
             page-break-after: always;
-        }}
+        }
         
-        .cover-page h1 {{
+        .cover-page h1 {
             font-size: 2.5em;
             margin-bottom: 0.5in;
             font-weight: 300;
-        }}
+        }
         
-        .cover-page .subtitle {{
+        .cover-page .subtitle {
             font-size: 1.3em;
             opacity: 0.9;
             margin-bottom: 0.5in;
-        }}
+        }
         
-        .cover-page .timestamp {{
+        .cover-page .timestamp {
             font-size: 1em;
             opacity: 0.8;
-        }}
+        }
         
-        .section-divider {{
+        .section-divider {
             page-break-before: always;
             margin: 0.5in 0;
             text-align: center;
@@ -196,125 +152,131 @@ class LinguaLintPDFGenerator:
             background: #f8f9fa;
             border-radius: 8px;
             page-break-after: avoid;
-        }}
+        }
         
-        .section-divider h2 {{
+        .section-divider h2 {
             color: #2c3e50;
             font-size: 1.8em;
             margin: 0;
-        }}
+        }
         
-        .report-section {{
+        .report-section {
             margin-bottom: 0.5in;
             page-break-inside: avoid;
-        }}
+        }
         
-        .toc {{
+        .toc {
             background: #f8f9fa;
             padding: 0.5in;
             border-radius: 8px;
             margin: 0.5in 0;
             page-break-after: always;
-        }}
+        }
         
-        .toc h2 {{
+        .toc h2 {
             color: #2c3e50;
             margin-top: 0;
             font-size: 1.5em;
-        }}
+        }
         
-        .toc ul {{
+        .toc ul {
             list-style: none;
             padding: 0;
-        }}
+        }
         
-        .toc li {{
+        .toc li {
             padding: 8px 0;
             border-bottom: 1px solid #eee;
-        }}
+        }
         
-        .toc a {{
+        .toc a {
             color: #3498db;
             text-decoration: none;
             font-size: 1em;
-        }}
+        }
         
         /* Image sizing for PDF */
-        img {{
+        img {
             max-width: 100% !important;
             height: auto !important;
             display: block;
             margin: 0.25in auto;
             page-break-inside: avoid;
-        }}
+        }
+        
+        /* Report charts are PNGs or SVGs - keep them inside the printable area */
+        img[src$=".png"], img[src$=".svg"] {
+            max-width: 95% !important;
+            max-height: 6in !important;
+        }
         
         /* Visualization containers */
-        .visualization {{
+        .visualization {
             text-align: center;
             margin: 0.25in 0;
             padding: 0.25in;
             background: #f8f9fa;
             border-radius: 8px;
             page-break-inside: avoid;
-        }}
+        }
         
-        .visualization img {{
+        .visualization img {
             max-width: 95% !important;
             max-height: 6in !important;
             width: auto !important;
             height: auto !important;
-        }}
+        }
         
         /* Tables */
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 0.25in 0;
             font-size: 9pt;
             page-break-inside: avoid;
-        }}
+        }
         
-        th, td {{
+        th, td {
             border: 1px solid #ddd;
             padding: 6px;
             text-align: left;
             word-wrap: break-word;
-        }}
+        }
         
-        th {{
+        th {
             background: #f2f2f2;
             font-weight: bold;
-        }}
+        }
         
         /* Headers */
-        h1 {{ font-size: 1.8em; margin: 0.5in 0 0.25in 0; page-break-after: avoid; }}
-        h2 {{ font-size: 1.5em; margin: 0.4in 0 0.2in 0; page-break-after: avoid; }}
-        h3 {{ font-size: 1.3em; margin: 0.3in 0 0.15in 0; page-break-after: avoid; }}
-        h4 {{ font-size: 1.1em; margin: 0.25in 0 0.1in 0; page-break-after: avoid; }}
+        h1 { font-size: 1.8em; margin: 0.5in 0 0.25in 0; page-break-after: avoid; }
+        h2 { font-size: 1.5em; margin: 0.4in 0 0.2in 0; page-break-after: avoid; }
+        h3 { font-size: 1.3em; margin: 0.3in 0 0.15in 0; page-break-after: avoid; }
+        h4 { font-size: 1.1em; margin: 0.25in 0 0.1in 0; page-break-after: avoid; }
         
         /* Paragraphs */
-        p {{
+        p {
             margin: 0.15in 0;
             text-align: justify;
-        }}
+        }
         
         /* Lists */
-        ul, ol {{
+        ul, ol {
             margin: 0.15in 0;
             padding-left: 0.5in;
-        }}
+        }
         
-        li {{
+        li {
             margin: 0.05in 0;
-        }}
+        }
         
         /* Stats grid - make it PDF friendly */
-        .stats-grid {{
+        .stats-grid {
             display: block !important;
             margin: 0.25in 0;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             display: inline-block;
             width: 30%;
             margin: 0.1in 1%;
@@ -324,29 +286,29 @@ class LinguaLintPDFGenerator:
             border-radius: 4px;
             text-align: center;
             vertical-align: top;
-        }}
+        }
         
-        .stat-number {{
+        .stat-number {
             font-size: 1.5em;
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 0.05in;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             color: #7f8c8d;
             font-size: 0.8em;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
         /* Grid sections for Core Subjects, Phenomena, Wikipedia - make PDF friendly */
-        .data-tables div[style*="display: grid"] {{
+        .data-tables div[style*="display: grid"] {
             display: block !important;
             margin: 0.25in 0;
-        }}
+        }
         
-        .data-tables div[style*="display: grid"] > div {{
+        .data-tables div[style*="display: grid"] > div {
             display: inline-block;
             width: 30%;
             margin: 0.1in 1%;
@@ -355,15 +317,15 @@ class LinguaLintPDFGenerator:
             vertical-align: top;
             box-sizing: border-box;
             font-size: 0.9em;
-        }}
+        }
         
         /* PDF grid container for converted grid sections */
-        .pdf-grid-container {{
+        .pdf-grid-container {
             display: block !important;
             margin: 0.25in 0;
-        }}
+        }
         
-        .pdf-grid-container > div {{
+        .pdf-grid-container > div {
             display: inline-block;
             width: 30%;
             margin: 0.1in 1%;
@@ -373,109 +335,120 @@ class LinguaLintPDFGenerator:
             box-sizing: border-box;
             font-size: 0.9em;
             page-break-inside: avoid;
-        }}
+        }
         
         /* Ensure grid items don't break across pages */
-        .data-tables div[style*="display: grid"] > div {{
+        .data-tables div[style*="display: grid"] > div {
             page-break-inside: avoid;
-        }}
+        }
         
         /* Risk badges */
-        .risk-badge {{
+        .risk-badge {
             padding: 3px 8px;
             border-radius: 12px;
             font-size: 0.7em;
             font-weight: bold;
             text-transform: uppercase;
-        }}
+        }
         
-        .risk-very-low {{ background: #2ecc71; color: white; }}
-        .risk-low {{ background: #27ae60; color: white; }}
-        .risk-moderate {{ background: #f39c12; color: white; }}
-        .risk-high {{ background: #e74c3c; color: white; }}
-        .risk-very-high {{ background: #c0392b; color: white; }}
+        .risk-very-low { background: #2ecc71; color: white; }
+        .risk-low { background: #27ae60; color: white; }
+        .risk-moderate { background: #f39c12; color: white; }
+        .risk-high { background: #e74c3c; color: white; }
+        .risk-very-high { background: #c0392b; color: white; }
         
         /* Entity table - make it more compact for PDF */
-        .entity-table {{
+        .entity-table {
             font-size: 8pt;
             margin: 0.25in 0;
-        }}
+        }
         
-        .entity-table th {{
+        .entity-table th {
             background: #34495e;
             color: white;
             padding: 8px 4px;
             font-size: 8pt;
-        }}
+        }
         
-        .entity-table td {{
+        .entity-table td {
             padding: 6px 4px;
             border-bottom: 1px solid #ecf0f1;
-        }}
+        }
         
         /* Methodology section */
-        .methodology {{
+        .methodology {
             background: #ecf0f1;
             padding: 0.25in;
             border-radius: 8px;
             margin: 0.25in 0;
             page-break-inside: avoid;
-        }}
+        }
         
-        .methodology h3 {{
+        .methodology h3 {
             color: #2c3e50;
             margin-top: 0;
-        }}
+        }
         
-        .methodology ul {{
+        .methodology ul {
             margin: 0.1in 0;
-        }}
+        }
         
         /* Force page breaks */
-        .page-break {{
+        .page-break {
             page-break-before: always;
-        }}
+        }
         
         /* Avoid page breaks */
-        .no-break {{
+        .no-break {
             page-break-inside: avoid;
-        }}
+        }
         
         /* Hide interactive elements in PDF */
-        script, .interactive-only {{
+        script, .interactive-only {
             display: none !important;
-        }}
+        }
         
         /* Ensure content fits in margins */
-        .container {{
+        .container {
             max-width: 100%;
             margin: 0;
             padding: 0;
-        }}
+        }
         
         /* D3.js visualization containers - make them PDF friendly */
-        #visualization, .d3-container {{
+        #visualization, .d3-container {
             display: none !important;
-        }}
+        }
         
         /* Replace D3 with static message */
-        .d3-replacement {{
+        .d3-replacement {
             text-align: center;
             padding: 0.5in;
             background: #f8f9fa;
             border: 2px dashed #ccc;
             border-radius: 8px;
             margin: 0.25in 0;
-        }}
-    </style>
+        }
+"""
+
+# Cover page, table of contents and opening of the main analysis section;
+# filled in with str.format for each combined report
+COMBINED_REPORT_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>LinguaLint Comprehensive Analysis Report - {timestamp}</title>
+    <style>{css}    </style>
 </head>
 <body>
     <!-- Cover Page -->
     <div class="cover-page">
         <h1>LinguaLint</h1>
         <div class="subtitle">Comprehensive Analysis Report</div>
-        <div class="timestamp">Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</div>
-        <div class="timestamp">Analysis ID: {self.timestamp}</div>
+        <div class="timestamp">Generated: {generated}</div>
+        <div class="timestamp">Analysis ID: {timestamp}</div>
     </div>
     
     <!-- Table of Contents -->
@@ -495,7 +468,9 @@ class LinguaLintPDFGenerator:
     </div>
     
     <div class="report-section">
-        {self._extract_body_content(main_content) if main_content else '<p>Main analysis report not available.</p>'}
+        """
+
+RESPONSIBILITY_SECTION_OPEN = """
     </div>
     
     <!-- Responsibility Analysis Section -->
@@ -504,7 +479,9 @@ class LinguaLintPDFGenerator:
     </div>
     
     <div class="report-section">
-        {self._extract_body_content(responsibility_content) if responsibility_content else '<p>Responsibility analysis report not available.</p>'}
+        """
+
+PROJECT_SECTION_OPEN = """
     </div>
     
     <!-- Project Management Section -->
@@ -513,7 +490,10 @@ class LinguaLintPDFGenerator:
     </div>
     
     <div class="report-section">
-        {self._extract_body_content(gantt_content) if gantt_content else '<p>Project timeline not available.</p>'}
+        """
+
+# Appendix and closing tags
+COMBINED_REPORT_FOOTER = """
     </div>
     
     <!-- Appendix -->
@@ -524,99 +504,355 @@ class LinguaLintPDFGenerator:
     <div class="report-section">
         <h3>Generated Files</h3>
         <ul>
-            <li>📄 Raw extraction data: extraction_{self.timestamp}.json</li>
-            <li>📊 Responsibility analysis: extraction_{self.timestamp}_responsibility_analysis.json</li>
-            <li>📈 Project plan: project_plan_{self.timestamp}.csv</li>
+            <li>📄 Raw extraction data: extraction_{timestamp}.json</li>
+            <li>📊 Responsibility analysis: extraction_{timestamp}_responsibility_analysis.json</li>
+            <li>📈 Project plan: project_plan_{timestamp}.csv</li>
             <li>🎨 Visualizations: Multiple PNG files with analysis charts</li>
         </ul>
         
         <h3>Analysis Metadata</h3>
-        <p><strong>Timestamp:</strong> {self.timestamp}</p>
-        <p><strong>Generated:</strong> {datetime.now().isoformat()}</p>
+        <p><strong>Timestamp:</strong> {timestamp}</p>
+        <p><strong>Generated:</strong> {generated_iso}</p>
         <p><strong>System:</strong> LinguaLint Event Code Extractor with Responsibility Futures Analysis</p>
     </div>
 </body>
 </html>
 """
+
+class ChromeSession:
+    """
+    Headless Chrome kept running across PDFs and driven over the DevTools
+    protocol, so a batch of reports pays the browser start-up cost once.
+    The browser is started on the first print and shut down by close().
+    """
+    
+    def __init__(self, chrome_cmd: Optional[str] = None):
+        self.chrome_cmd = chrome_cmd or CHROME_CMD
+        self._process = None
+        self._user_data_dir = None
+        self._loop = None
+        self._http = None
+        self._ws = None
+        self._message_id = 0
+        self._events = []
+    
+    def __enter__(self) -> 'ChromeSession':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def print_to_pdf(self, html_file: Path, pdf_file: Path) -> None:
+        """Render one HTML file to PDF in a fresh tab, within CHROME_TIMEOUT seconds"""
+        try:
+            if self._process is None:
+                self._start()
+            self._loop.run_until_complete(asyncio.wait_for(self._print(html_file, pdf_file), CHROME_TIMEOUT))
+        except BaseException:
+            # A browser that failed or stalled is not reused; the next PDF starts a fresh one
+            self.close()
+            raise
+    
+    def close(self) -> None:
+        """Shut down the browser and remove its temporary profile"""
+        # The browser goes first, without a DevTools request it might never
+        # answer; closing the connections afterwards then cannot wait on it
+        if self._process:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        
+        if self._loop:
+            for connection in (self._ws, self._http):
+                if connection is not None:
+                    try:
+                        self._loop.run_until_complete(connection.close())
+                    except Exception:
+                        pass
+            self._loop.close()
+        
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+        
+        self._process = self._user_data_dir = self._loop = self._http = self._ws = None
+        self._message_id = 0
+        self._events = []
+    
+    def _start(self) -> None:
+        """Launch Chrome with a DevTools port and connect to the browser endpoint"""
+        if not self.chrome_cmd:
+            raise RuntimeError("Chrome/Chromium not found")
+        
+        self._user_data_dir = tempfile.mkdtemp(prefix="lingualint_chrome_")
+        self._process = subprocess.Popen([
+            self.chrome_cmd,
+            '--headless',
+            '--disable-gpu',
+            '--remote-debugging-port=0',
+            '--user-data-dir=' + self._user_data_dir,
+            '--no-first-run',
+            'about:blank'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        # Chrome writes the port it picked and the browser endpoint path here
+        port_file = Path(self._user_data_dir) / 'DevToolsActivePort'
+        deadline = time.monotonic() + CHROME_TIMEOUT
+        while True:
+            lines = port_file.read_text().splitlines() if port_file.exists() else []
+            if len(lines) >= 2:
+                break
+            if self._process.poll() is not None:
+                raise RuntimeError("Chrome exited before opening the DevTools port")
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for the Chrome DevTools port")
+            time.sleep(0.05)
+        
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._connect(f"ws://127.0.0.1:{lines[0]}{lines[1]}"))
+    
+    async def _connect(self, ws_url: str) -> None:
+        import aiohttp
+        self._http = aiohttp.ClientSession()
+        # printToPDF returns the whole document base64-encoded in one message
+        self._ws = await self._http.ws_connect(ws_url, max_msg_size=0)
+    
+    async def _send(self, method: str, params: Optional[Dict] = None, session_id: Optional[str] = None) -> Dict:
+        """Send one DevTools command and return its result, queueing any events that arrive first"""
+        self._message_id += 1
+        message = {'id': self._message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        await self._ws.send_json(message)
+        
+        while True:
+            reply = await self._ws.receive_json()
+            if reply.get('id') == message['id']:
+                if 'error' in reply:
+                    raise RuntimeError(f"{method} failed: {reply['error'].get('message')}")
+                return reply.get('result', {})
+            self._events.append(reply)
+    
+    async def _wait_for_load(self, session_id: str, loader_id: str) -> None:
+        """Wait for the load lifecycle event of one navigation"""
+        def is_load(event):
+            params = event.get('params', {})
+            return (event.get('sessionId') == session_id and event.get('method') == 'Page.lifecycleEvent'
+                    and params.get('name') == 'load' and params.get('loaderId') == loader_id)
+        
+        if any(is_load(event) for event in self._events):
+            return
+        while not is_load(await self._ws.receive_json()):
+            pass
+    
+    async def _print(self, html_file: Path, pdf_file: Path) -> None:
+        # Runs under a timeout: if it fails or is cancelled, nothing more is sent
+        # over the connection and print_to_pdf shuts the whole browser down, tab
+        # included, so the tab is only closed here once the PDF is written
+        self._events.clear()
+        target = await self._send('Target.createTarget', {'url': 'about:blank'})
+        attached = await self._send('Target.attachToTarget', {'targetId': target['targetId'], 'flatten': True})
+        session_id = attached['sessionId']
+        
+        await self._send('Page.enable', session_id=session_id)
+        await self._send('Page.setLifecycleEventsEnabled', {'enabled': True}, session_id)
+        navigation = await self._send('Page.navigate', {'url': html_file.absolute().as_uri()}, session_id)
+        await self._wait_for_load(session_id, navigation['loaderId'])
+        
+        result = await self._send('Page.printToPDF', {
+            'displayHeaderFooter': False,
+            'preferCSSPageSize': True
+        }, session_id)
+        pdf_file.write_bytes(base64.b64decode(result['data']))
+        
+        self._events.clear()
+        await self._send('Target.closeTarget', {'targetId': target['targetId']})
+
+class LinguaLintPDFGenerator:
+    """
+    Generates comprehensive PDF reports from LinguaLint HTML outputs
+    """
+    
+    def __init__(self, timestamp: str, analysis_dir: Path = None, chrome_session: Optional[ChromeSession] = None):
+        self.timestamp = timestamp
+        self.analysis_dir = analysis_dir
+        self.chrome_session = chrome_session
+        self.root_dir = Path(".")
         
-        with open(combined_html, 'w', encoding='utf-8') as f:
-            f.write(combined_content)
+        if analysis_dir:
+            # Use provided analysis directory
+            self.output_dir = analysis_dir
+            print(f"📁 Using existing analysis directory: {self.output_dir}")
+        else:
+            # Create lingualint_analysis directory structure (legacy mode)
+            self.super_dir = self.root_dir / "lingualint_analysis"
+            self.super_dir.mkdir(exist_ok=True)
+            
+            # Create specific analysis folder within super folder
+            self.output_dir = self.super_dir / f"analysis_{timestamp}"
+            self.output_dir.mkdir(exist_ok=True)
+            
+            print(f"📁 PDF super directory: {self.super_dir}")
+            print(f"📁 Analysis output directory: {self.output_dir}")
+        
+        self.combined_html_file = self.output_dir / f"combined_report_{timestamp}.html"
+        self.pdf_file = self.output_dir / f"lingualint_analysis_{timestamp}.pdf"
+        
+        # PDF backends installed on this machine, in order of preference
+        self.pdf_backends = [
+            backend for backend, available in (
+                (self.generate_pdf_weasyprint, PDF_WEASYPRINT_AVAILABLE),
+                (self.generate_pdf_pdfkit, PDF_PDFKIT_AVAILABLE),
+                (self.generate_pdf_chrome, CHROME_CMD is not None)
+            ) if available
+        ]
+    
+    def find_html_reports(self) -> Dict[str, Optional[Path]]:
+        """Find all HTML reports for the given timestamp"""
+        # List the analysis directory once instead of stat-ing each report
+        try:
+            with os.scandir(self.output_dir) as entries:
+                filenames = {entry.name for entry in entries}
+        except FileNotFoundError:
+            filenames = set()
+        
+        report_filenames = {
+            'main_report': f"report_{self.timestamp}.html",
+            'responsibility_report': f"responsibility_report_{self.timestamp}.html",
+            'gantt_chart': f"gantt_chart_{self.timestamp}.html"
+        }
+        
+        return {
+            report_type: self.output_dir / filename if filename in filenames else None
+            for report_type, filename in report_filenames.items()
+        }
+    
+    def copy_assets_to_output(self) -> None:
+        """Assets are already in the output directory, so this is a no-op"""
+        print("📋 Assets already in analysis directory - no copying needed")
+        
+        # List existing assets, sorting them by type in one pass over the directory
+        png_files, json_files, csv_files = [], [], []
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if self.timestamp not in name:
+                    continue
+                if name.endswith('.png'):
+                    png_files.append(name)
+                elif name.endswith('.json'):
+                    json_files.append(name)
+                elif name.endswith('.csv'):
+                    csv_files.append(name)
+        
+        for png_file in png_files:
+            print(f"   📊 Found: {png_file}")
+        for json_file in json_files:
+            print(f"   📄 Found: {json_file}")
+        for csv_file in csv_files:
+            print(f"   📈 Found: {csv_file}")
+    
+    def create_combined_html(self, reports: Dict[str, Optional[Path]]) -> Path:
+        """Create a combined HTML document with all reports"""
+        print("📄 Creating combined HTML document...")
+        
+        combined_html = self.combined_html_file
+        
+        # Read the source reports concurrently; each body is still cleaned and
+        # streamed into the combined document in order as soon as it arrives
+        with ThreadPoolExecutor(max_workers=3) as executor, open(combined_html, 'w', encoding='utf-8') as f:
+            reads = {
+                report_type: executor.submit(report_path.read_text, encoding='utf-8')
+                for report_type, report_path in reports.items() if report_path
+            }
+            
+            f.write(COMBINED_REPORT_HEADER.format(
+                timestamp=self.timestamp,
+                css=COMBINED_REPORT_CSS,
+                generated=datetime.now().strftime('%B %d, %Y at %I:%M %p')
+            ))
+            f.write(self._report_body(reads.get('main_report'), '<p>Main analysis report not available.</p>'))
+            f.write(RESPONSIBILITY_SECTION_OPEN)
+            f.write(self._report_body(reads.get('responsibility_report'), '<p>Responsibility analysis report not available.</p>'))
+            f.write(PROJECT_SECTION_OPEN)
+            f.write(self._report_body(reads.get('gantt_chart'), '<p>Project timeline not available.</p>'))
+            f.write(COMBINED_REPORT_FOOTER.format(
+                timestamp=self.timestamp,
+                generated_iso=datetime.now().isoformat()
+            ))
         
         print(f"✅ Combined HTML created: {combined_html}")
         return combined_html
     
+    def _report_body(self, pending_read: Optional[Future], fallback: str) -> str:
+        """Wait for one report read and return its PDF-ready body, or the fallback if it is missing"""
+        if pending_read is None:
+            return fallback
+        
+        html_content = pending_read.result()
+        return self._extract_body_content(html_content) if html_content else fallback
+    
     def _extract_body_content(self, html_content: str) -> str:
         """Extract content from HTML body, removing head and script tags, and optimizing for PDF"""
-        import re
-        
-        # Extract body content
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', html_content, re.DOTALL | re.IGNORECASE)
-        if body_match:
-            body_content = body_match.group(1)
+        # Extract body content; generated reports use lowercase tags, so find
+        # them with plain str.find before trying the case-insensitive regex
+        body_start = html_content.find('<body')
+        if body_start >= 0:
+            body_start = html_content.find('>', body_start) + 1
+        body_end = html_content.find('</body>', body_start) if body_start > 0 else -1
+        
+        if body_end >= 0:
+            body_content = html_content[body_start:body_end]
         else:
-            # If no body tag, take everything after head
-            head_end = re.search(r'</head>', html_content, re.IGNORECASE)
-            if head_end:
-                body_content = html_content[head_end.end():]
+            body_match = BODY_RE.search(html_content)
+            if body_match:
+                body_content = body_match.group(1)
             else:
-                body_content = html_content
-        
-        # Remove script tags and interactive elements
-        body_content = re.sub(r'<script[^>]*>.*?</script>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-        body_content = re.sub(r'<button[^>]*>.*?</button>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove D3.js visualization divs and replace with static message
-        body_content = re.sub(
-            r'<div[^>]*id="visualization"[^>]*>.*?</div>',
-            '<div class="d3-replacement"><p><strong>Interactive D3.js Visualization</strong><br/>This section contains an interactive network graph that is available in the HTML version of this report.</p></div>',
-            body_content,
-            flags=re.DOTALL | re.IGNORECASE
-        )
-        
-        # Update image paths to be relative and add PDF-friendly sizing
-        body_content = re.sub(r'<img([^>]*?)src="([^"]*\.png)"([^>]*?)>', r'<img\1src="\2"\3 style="max-width: 95% !important; max-height: 6in !important; height: auto !important; display: block; margin: 0.25in auto;">', body_content)
-        
-        # Fix stats grid for PDF
-        body_content = re.sub(
-            r'<div[^>]*class="stats-grid"[^>]*>',
-            '<div class="stats-grid">',
-            body_content
-        )
+                # If no body tag, take everything after head
+                head_end = HEAD_END_RE.search(html_content)
+                if head_end:
+                    body_content = html_content[head_end.end():]
+                else:
+                    body_content = html_content
+        
+        # Strip scripts, buttons, controls and the D3 container, and add
+        # PDF-friendly sizing to tables and visualizations (images are sized
+        # by the img rules in COMBINED_REPORT_CSS)
+        body_content = BODY_TAGS_RE.sub(self._rewrite_body_tag, body_content)
         
         # Fix CSS grid sections for PDF (Core Subjects, Phenomena, Wikipedia)
-        body_content = re.sub(
-            r'<div style="display: grid; grid-template-columns: repeat\(auto-fill, minmax\(200px, 1fr\)\); gap: 10px; margin: 20px 0;">',
-            '<div class="pdf-grid-container">',
-            body_content
-        )
-        
-        # Make tables more PDF-friendly
-        body_content = re.sub(r'<table([^>]*?)>', r'<table\1 style="font-size: 9pt; page-break-inside: avoid;">', body_content)
-        
-        # Add page break avoidance to visualization containers
-        body_content = re.sub(
-            r'<div[^>]*class="visualization"[^>]*>',
-            '<div class="visualization no-break">',
-            body_content
-        )
-        
-        # Remove any remaining interactive controls
-        body_content = re.sub(r'<div[^>]*class="controls"[^>]*>.*?</div>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
+        body_content = body_content.replace(CSS_GRID_DIV, '<div class="pdf-grid-container">')
         
         # Clean up excessive whitespace
-        body_content = re.sub(r'\n\s*\n\s*\n', '\n\n', body_content)
+        body_content = BLANK_LINES_RE.sub('\n\n', body_content)
         
         return body_content
     
+    def _rewrite_body_tag(self, match: re.Match) -> str:
+        """Return the PDF replacement for one BODY_TAGS_RE match"""
+        kind = match.lastgroup
+        if kind == 'visualization_div':
+            # Replace D3.js visualization with static message
+            return D3_REPLACEMENT_HTML
+        if kind == 'table':
+            return f'<table{match.group("table_attrs")} style="font-size: 9pt; page-break-inside: avoid;">'
+        if kind == 'visualization_class':
+            return '<div class="visualization no-break">'
+        # Scripts, buttons and interactive controls are dropped
+        return ''
+    
     def generate_pdf_weasyprint(self, html_file: Path) -> Optional[Path]:
         """Generate PDF using WeasyPrint"""
         if not PDF_WEASYPRINT_AVAILABLE:
             return None
         
         try:
-            pdf_file = self.output_dir / f"lingualint_analysis_{self.timestamp}.pdf"
+            pdf_file = self.pdf_file
             
             print("🔄 Generating PDF with WeasyPrint...")
+            weasyprint = _load_weasyprint()
             weasyprint.HTML(filename=str(html_file)).write_pdf(str(pdf_file))
             
             print(f"✅ PDF generated: {pdf_file}")
@@ -632,7 +868,7 @@ class LinguaLintPDFGenerator:
             return None
         
         try:
-            pdf_file = self.output_dir / f"lingualint_analysis_{self.timestamp}.pdf"
+            pdf_file = self.pdf_file
             
             print("🔄 Generating PDF with pdfkit...")
             
@@ -647,6 +883,7 @@ class LinguaLintPDFGenerator:
                 'enable-local-file-access': None
             }
             
+            pdfkit = _load_pdfkit()
             pdfkit.from_file(str(html_file), str(pdf_file), options=options)
             
             print(f"✅ PDF generated: {pdf_file}")
@@ -659,32 +896,22 @@ class LinguaLintPDFGenerator:
     def generate_pdf_chrome(self, html_file: Path) -> Optional[Path]:
         """Generate PDF using Chrome/Chromium headless"""
         try:
-            pdf_file = self.output_dir / f"lingualint_analysis_{self.timestamp}.pdf"
+            pdf_file = self.pdf_file
             
             print("🔄 Generating PDF with Chrome headless...")
             
-            # Try different Chrome/Chromium executables
-            chrome_commands = [
-                'google-chrome',
-                'chromium',
-                'chromium-browser',
-                '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-                '/usr/bin/google-chrome',
-                '/usr/bin/chromium'
-            ]
-            
-            chrome_cmd = None
-            for cmd in chrome_commands:
-                if shutil.which(cmd) or Path(cmd).exists():
-                    chrome_cmd = cmd
-                    break
-            
-            if not chrome_cmd:
+            if not CHROME_CMD:
                 print("❌ Chrome/Chromium not found")
                 return None
             
+            # Reuse the running browser when generating a batch of PDFs
+            if self.chrome_session:
+                self.chrome_session.print_to_pdf(html_file, pdf_file)
+                print(f"✅ PDF generated: {pdf_file}")
+                return pdf_file
+            
             cmd = [
-                chrome_cmd,
+                CHROME_CMD,
                 '--headless',
                 '--disable-gpu',
                 '--print-to-pdf=' + str(pdf_file),
@@ -698,7 +925,7 @@ class LinguaLintPDFGenerator:
                 'file://' + str(html_file.absolute())
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=CHROME_TIMEOUT)
             
             if result.returncode == 0 and pdf_file.exists():
                 print(f"✅ PDF generated: {pdf_file}")
@@ -735,23 +962,26 @@ class LinguaLintPDFGenerator:
         # Copy assets to output directory
         self.copy_assets_to_output()
         
-        # Create combined HTML
-        combined_html = self.create_combined_html(reports)
+        # Create combined HTML, unless it is newer than every source report and
+        # than this module, which holds its template
+        sources_mtime = max(path.stat().st_mtime for path in [Path(__file__), *filter(None, reports.values())])
+        if _is_newer(self.combined_html_file, sources_mtime):
+            combined_html = self.combined_html_file
+            print(f"♻️  Combined HTML is up to date: {combined_html}")
+        else:
+            combined_html = self.create_combined_html(reports)
         
-        # Try different PDF generation methods
+        # Try the installed PDF backends in order of preference:
+        # WeasyPrint (best for complex CSS), pdfkit (wkhtmltopdf), Chrome headless
         pdf_file = None
-        
-        # Method 1: WeasyPrint (best for complex CSS)
-        if PDF_WEASYPRINT_AVAILABLE:
-            pdf_file = self.generate_pdf_weasyprint(combined_html)
-        
-        # Method 2: pdfkit (wkhtmltopdf)
-        if not pdf_file and PDF_PDFKIT_AVAILABLE:
-            pdf_file = self.generate_pdf_pdfkit(combined_html)
-        
-        # Method 3: Chrome headless (fallback)
-        if not pdf_file:
-            pdf_file = self.generate_pdf_chrome(combined_html)
+        if _is_newer(self.pdf_file, combined_html.stat().st_mtime):
+            pdf_file = self.pdf_file
+            print(f"♻️  PDF is up to date: {pdf_file}")
+        else:
+            for backend in self.pdf_backends:
+                pdf_file = backend(combined_html)
+                if pdf_file:
+                    break
         
         if pdf_file:
             file_size = pdf_file.stat().st_size
@@ -775,11 +1005,12 @@ class LinguaLintPDFGenerator:
         
         return pdf_file
 
-def generate_comprehensive_pdf(timestamp: str, analysis_dir: Path = None) -> Optional[Path]:
+def generate_comprehensive_pdf(timestamp: str, analysis_dir: Path = None,
+                               chrome_session: Optional[ChromeSession] = None) -> Optional[Path]:
     """
     Main function to generate comprehensive PDF from LinguaLint reports
     """
-    generator = LinguaLintPDFGenerator(timestamp, analysis_dir)
+    generator = LinguaLintPDFGenerator(timestamp, analysis_dir, chrome_session)
     return generator.generate_comprehensive_pdf()
 
 def main():
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+LinguaLint - AI-powered project planning and analysis platform
+Copyright (C) 2026 Jefferson Richards
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+"""
+Multi-phrase containment matching for LinguaLint
+
+Answers "which of these phrases occur in this text" for many texts against
+one fixed phrase list. With pyahocorasick installed every phrase is found
+in a single scan of the text; otherwise each phrase gets its own substring
+search. Either way the result matches `phrase in text` for every phrase.
+Matchers are cached per phrase list, so the report and the responsibility
+analysis of one extraction share the same automaton.
+"""
+
+from functools import lru_cache
+from typing import Callable, List, Sequence, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+def build_phrase_matcher(phrases: Sequence[str]) -> Callable[[str], List[int]]:
+    """
+    Return a function giving the indices of the phrases contained in a text,
+    in phrase order. Callers lowercase both sides for case-insensitive matching.
+    """
+    return _cached_phrase_matcher(tuple(phrases))
+
+@lru_cache(maxsize=32)
+def _cached_phrase_matcher(phrases: Tuple[str, ...]) -> Callable[[str], List[int]]:
+    if not AHOCORASICK_AVAILABLE or not any(phrases):
+        return lambda text: [j for j, phrase in enumerate(phrases) if phrase in text]
+    
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        if phrase:
+            automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    
+    def match_phrases(text):
+        hits = {phrase for _, phrase in automaton.iter(text)}
+        # An empty phrase is contained in every text, as with `in`
+        return [j for j, phrase in enumerate(phrases) if not phrase or phrase in hits]
+    
+    return match_phrases
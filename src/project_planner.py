@@ -24,36 +24,78 @@ Generates MS Project CSV and Gantt chart visualizations from risk factor analysi
 Creates actionable project plans based on extracted subjects, phenomena, and Wikipedia data.
 """
 
-import json
+import sys
 import csv
+from functools import lru_cache
 from datetime import datetime, timedelta
-import pandas as pd
+import numpy as np
 from pathlib import Path
+from typing import NamedTuple
+
+from .json_writer import read_json
+
+class Task(NamedTuple):
+    """One project plan task; fields are the MS Project CSV columns, in order"""
+    ID: int
+    Task_Name: str
+    Duration: str
+    Start_Date: str
+    Finish_Date: str
+    Predecessors: str
+    Resource_Names: str
+    Notes: str
+
+# MS Project CSV columns; a Task is already a row in this order
+CSV_HEADERS = list(Task._fields)
+
+@lru_cache(maxsize=256)
+def format_day(moment):
+    """YYYY-MM-DD for a task date; tasks share a few phase dates, so each is formatted once"""
+    return moment.strftime("%Y-%m-%d")
+
+@lru_cache(maxsize=None)
+def resource_css_class(resource):
+    """Gantt bar CSS class for a resource name; there are only a handful, so each is built once"""
+    return resource.lower().replace(' ', '-') or 'milestone'
 
 class LinguaLintProjectPlanner:
-    def __init__(self, json_file):
-        with open(json_file, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+    def __init__(self, json_file, csv_file=None):
+        # Accept an already-parsed extraction document as well as a path
+        if isinstance(json_file, dict):
+            self.data = json_file
+        else:
+            self.data = read_json(Path(json_file).read_bytes())
         
         self.source = self.data.get('_source', {})
         self.project_start = datetime.fromisoformat(self.source.get('@timestamp', datetime.now().isoformat()))
         self.tasks = []
         self.task_id = 1
+        
+        # With a csv_file, each task is written out as soon as it is added
+        self.csv_file = csv_file
+        self._csv_stream = None
+        self._csv_writer = None
+        if csv_file is not None:
+            self._csv_stream = open(csv_file, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.writer(self._csv_stream)
+            self._csv_writer.writerow(CSV_HEADERS)
     
     def add_task(self, name, duration_days, start_date, predecessors="", resources="", notes=""):
         """Add a task to the project plan"""
         finish_date = start_date + timedelta(days=duration_days)
-        task = {
-            'ID': self.task_id,
-            'Task_Name': name,
-            'Duration': f"{duration_days} days",
-            'Start_Date': start_date.strftime("%Y-%m-%d"),
-            'Finish_Date': finish_date.strftime("%Y-%m-%d"),
-            'Predecessors': predecessors,
-            'Resource_Names': resources,
-            'Notes': notes
-        }
+        task = Task(
+            ID=self.task_id,
+            Task_Name=name,
+            Duration=f"{duration_days} days",
+            Start_Date=format_day(start_date),
+            Finish_Date=format_day(finish_date),
+            Predecessors=predecessors,
+            Resource_Names=resources,
+            Notes=notes
+        )
         self.tasks.append(task)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(task)
         current_id = self.task_id
         self.task_id += 1
         return current_id, finish_date
@@ -103,15 +145,16 @@ class LinguaLintProjectPlanner:
         sentences = self.source.get('sentences', [])
         action_ids = []
         
-        for i, sent in enumerate(sentences):
-            warm_vector = sent.get('warm_vector', [0, 0, 0])
-            cold_vector = sent.get('cold_vector', [0, 0, 0])
-            
-            warm_score = sum(v for v in warm_vector if v is not None)
-            cold_score = sum(v for v in cold_vector if v is not None)
+        # Score every sentence at once; None entries become NaN and count as zero
+        warm_scores = np.nansum(np.array([s.get('warm_vector', [0, 0, 0]) for s in sentences], dtype=float).reshape(-1, 3), axis=1)
+        cold_scores = np.nansum(np.array([s.get('cold_vector', [0, 0, 0]) for s in sentences], dtype=float).reshape(-1, 3), axis=1)
+        
+        # Only sentences above either threshold become tasks, in sentence order
+        for i in np.flatnonzero((cold_scores > 0.1) | (warm_scores > 0.1)).tolist():
+            sent = sentences[i]
             
             # High-risk items need immediate attention
-            if cold_score > 0.1:
+            if cold_scores[i] > 0.1:
                 task_name = f"Mitigate High Risk Item #{i+1}"
                 duration = 3
                 resource = "Risk Manager"
@@ -123,7 +166,7 @@ class LinguaLintProjectPlanner:
                 action_ids.append(a_id)
             
             # Positive opportunities
-            elif warm_score > 0.1:
+            else:
                 task_name = f"Leverage Opportunity #{i+1}"
                 duration = 2
                 resource = "Strategy Lead"
@@ -160,16 +203,22 @@ class LinguaLintProjectPlanner:
     
     def save_ms_project_csv(self, filename="lingualint_project_plan.csv"):
         """Save project plan as MS Project compatible CSV"""
-        headers = ['ID', 'Task_Name', 'Duration', 'Start_Date', 'Finish_Date', 
-                  'Predecessors', 'Resource_Names', 'Notes']
-        
+        # Tasks are tuples in column order, so the C csv writer takes them as rows
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS)
             writer.writerows(self.tasks)
         
         return filename
     
+    def close_csv(self):
+        """Finish the CSV being streamed by add_task and return its filename"""
+        if self._csv_stream is not None:
+            self._csv_stream.close()
+            self._csv_stream = None
+            self._csv_writer = None
+        return self.csv_file
+    
     def create_html_gantt(self, output_file="lingualint_gantt_chart.html"):
         """Create interactive HTML Gantt chart"""
         if not self.tasks:
@@ -217,16 +266,16 @@ class LinguaLintProjectPlanner:
         """
         
         for task in self.tasks:
-            resource_class = task['Resource_Names'].lower().replace(' ', '-') or 'milestone'
+            resource_class = resource_css_class(task.Resource_Names)
             html_content += f"""
                 <tr>
-                    <td>{task['ID']}</td>
-                    <td>{task['Task_Name']}</td>
-                    <td>{task['Duration']}</td>
-                    <td>{task['Start_Date']}</td>
-                    <td>{task['Finish_Date']}</td>
-                    <td>{task['Resource_Names']}</td>
-                    <td><div class="task-bar {resource_class}" title="{task['Notes'][:100]}"></div></td>
+                    <td>{task.ID}</td>
+                    <td>{task.Task_Name}</td>
+                    <td>{task.Duration}</td>
+                    <td>{task.Start_Date}</td>
+                    <td>{task.Finish_Date}</td>
+                    <td>{task.Resource_Names}</td>
+                    <td><div class="task-bar {resource_class}" title="{task.Notes[:100]}"></div></td>
                 </tr>
             """
         
@@ -253,8 +302,11 @@ class LinguaLintProjectPlanner:
         
         return output_file
 
-def generate_project_plan(json_file, output_dir=None):
-    """Generate complete project plan from LinguaLint analysis"""
+def generate_project_plan(json_file, output_dir=None, data=None):
+    """
+    Generate complete project plan from LinguaLint analysis. Callers that
+    have already parsed json_file can pass its data.
+    """
     if output_dir is None:
         # Default to the same directory as the JSON file
         output_dir = Path(json_file).parent
@@ -262,18 +314,20 @@ def generate_project_plan(json_file, output_dir=None):
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
-    # Initialize planner
-    planner = LinguaLintProjectPlanner(json_file)
-    planner.generate_project_plan()
-    
     # Generate outputs
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     csv_file = output_path / f"project_plan_{timestamp}.csv"
     html_file = output_path / f"gantt_chart_{timestamp}.html"
     
+    # Initialize planner; the CSV is written task by task while planning
+    planner = LinguaLintProjectPlanner(data if data is not None else read_json(Path(json_file).read_bytes()), csv_file=csv_file)
+    try:
+        planner.generate_project_plan()
+    finally:
+        planner.close_csv()
+    
     # Save files
-    planner.save_ms_project_csv(csv_file)
     planner.create_html_gantt(html_file)
     
     return {
@@ -283,10 +337,8 @@ def generate_project_plan(json_file, output_dir=None):
     }
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 2:
-        print("Usage: python project_planner.py <json_file>")
+        print("Usage: python -m src.project_planner <json_file>")
         sys.exit(1)
     
     json_file = sys.argv[1]
@@ -24,93 +24,37 @@ Generates self-contained HTML report with D3.js force-directed graph
 from extracted JSON data.
 """
 
+import os
+import re
+import sys
 import json
+import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-def generate_html_report(json_file, output_file="index.html"):
-    """Generate self-contained HTML report with D3.js visualization"""
-    
-    # Load JSON data
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Extract data from the nested structure
-    source_data = data.get('_source', {})
-    sentences = source_data.get('sentences', [])
-    subjects = source_data.get('subjects', [])
-    phen = source_data.get('phen', [])
-    wiki_data = source_data.get('wiki', [])
-    
-    # Build graph links with better connectivity
-    links = []
-    nodes_set = set()
-    
-    # Create hierarchical structure: Sentences -> Subjects -> Phenomena -> Wikipedia
-    for i, sentence in enumerate(sentences):
-        sentence_node = f"S{i}: {sentence['sentence'][:40]}..."
-        nodes_set.add(sentence_node)
-        
-        # Link sentences to their subjects
-        sentence_subjects = [subj for subj in subjects if subj.lower() in sentence['sentence'].lower()]
-        for subj in sentence_subjects[:3]:  # Limit to 3 subjects per sentence
-            subj_node = f"SUBJ: {subj}"
-            nodes_set.add(subj_node)
-            links.append({
-                "source": sentence_node,
-                "target": subj_node,
-                "color": "#2E8B57"  # Sea green for sentence-subject links
-            })
-            
-            # Link subjects to related phenomena
-            related_phen = [p for p in phen if any(word in p.lower() for word in subj.lower().split())]
-            for phenomenon in related_phen[:2]:  # Limit to 2 phenomena per subject
-                phen_node = f"PHEN: {phenomenon}"
-                nodes_set.add(phen_node)
-                links.append({
-                    "source": subj_node,
-                    "target": phen_node,
-                    "color": "#4169E1"  # Royal blue for subject-phenomena links
-                })
-    
-    # Link phenomena to Wikipedia entries
-    for i, wiki in enumerate(wiki_data):
-        wiki_concept = wiki.get('wiki_search_content', '')
-        wiki_node = f"WIKI: {wiki_concept}"
-        nodes_set.add(wiki_node)
-        
-        # Find matching phenomena for this wiki entry
-        matching_phen = [p for p in phen if wiki_concept.lower() in p.lower() or p.lower() in wiki_concept.lower()]
-        for phenomenon in matching_phen[:1]:  # One wiki per phenomenon
-            phen_node = f"PHEN: {phenomenon}"
-            if phen_node in nodes_set:
-                links.append({
-                    "source": phen_node,
-                    "target": wiki_node,
-                    "color": "#FF6347"  # Tomato red for phenomena-wiki links
-                })
-    
-    # Convert to JSON strings for embedding
-    links_json = json.dumps(links, indent=2)
-    
-    # Generate HTML content
-    html_content = f"""<!DOCTYPE html>
+from .json_writer import read_json
+from .phrase_matcher import build_phrase_matcher
+
+# Static parts of the HTML report, written around the per-item rows.
+# Page head, links, graph container and the opening of the subjects grid
+REPORT_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>LinguaLint Analysis Report</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ margin-bottom: 30px; }}
-        .header a {{ margin-right: 15px; color: #0066cc; }}
-        .node {{ stroke: #fff; stroke-width: 2px; }}
-        .link {{ stroke: #777; stroke-width: 1px; }}
-        .controls {{ margin: 20px 0; }}
-        .data-tables {{ margin-top: 30px; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        .phenomenon {{ color: blue; font-weight: bold; }}
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { margin-bottom: 30px; }
+        .header a { margin-right: 15px; color: #0066cc; }
+        .node { stroke: #fff; stroke-width: 2px; }
+        .link { stroke: #777; stroke-width: 1px; }
+        .controls { margin: 20px 0; }
+        .data-tables { margin-top: 30px; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .phenomenon { color: blue; font-weight: bold; }
     </style>
 </head>
 <body>
@@ -133,17 +77,23 @@ def generate_html_report(json_file, output_file="index.html"):
     <div class="data-tables">
         <h2>Core Subjects (Capitalized Entities)</h2>
         <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 10px; margin: 20px 0;">
-            {''.join(f'<div style="background: #e6f3ff; padding: 8px; border-radius: 4px; border-left: 3px solid #0066cc;"><span class="phenomenon">{subj}</span></div>' for subj in subjects)}
+            """
+
+PHENOMENA_SECTION = """
         </div>
         
         <h2>Phenomena (Non-capitalized Concepts)</h2>
         <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 10px; margin: 20px 0;">
-            {''.join(f'<div style="background: #f0f8e6; padding: 8px; border-radius: 4px; border-left: 3px solid #66cc00;"><span>{concept}</span></div>' for concept in phen)}
+            """
+
+WIKI_CANDIDATES_SECTION = """
         </div>
         
         <h2>Wikipedia Candidates</h2>
         <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 10px; margin: 20px 0;">
-            {''.join(f'<div style="background: #fff0f5; padding: 8px; border-radius: 4px; border-left: 3px solid #ff69b4;"><span>{candidate}</span></div>' for candidate in source_data.get("wiki_blues", []))}
+            """
+
+SENTENCES_SECTION = """
         </div>
         
         <h2>Extracted Sentences</h2>
@@ -152,7 +102,9 @@ def generate_html_report(json_file, output_file="index.html"):
                 <tr><th>Sentence</th><th>Warm Vector<br><small>(Positivity, Engagement, Optimism)</small></th><th>Cold Vector<br><small>(Negativity, Risk, Uncertainty)</small></th></tr>
             </thead>
             <tbody>
-                {"".join(f'<tr><td>{highlight_phenomena(s["sentence"], phen)}</td><td>{format_vector(s.get("warm_vector", [0,0,0]), "warm")}</td><td>{format_vector(s.get("cold_vector", [0,0,0]), "cold")}</td></tr>' for s in sentences)}
+                """
+
+WIKI_ENRICHMENT_SECTION = """
             </tbody>
         </table>
         
@@ -162,152 +114,412 @@ def generate_html_report(json_file, output_file="index.html"):
                 <tr><th>Concept</th><th>Summary</th><th>URL</th></tr>
             </thead>
             <tbody>
-                {"".join(f'<tr><td>{w.get("wiki_search_content", "")}</td><td>{w.get("wiki_summary", "")[:200]}...</td><td><a href="{w.get("wiki_url", "")}" target="_blank">{w.get("wiki_url", "").split("/")[-1].replace("_", " ")}</a></td></tr>' for w in wiki_data)}
+                """
+
+# D3.js force layout; the graph links are embedded between these two parts
+REPORT_SCRIPT_OPEN = """
             </tbody>
         </table>
     </div>
 
-    <script src="https://d3js.org/d3.v3.min.js"></script>
+    <script src="https://d3js.org/d3.v7.min.js" defer></script>
     <script>
         // Embedded data
-        var graphData = {links_json};
+        var graphData = """
+
+# Between the links and the node positions computed by layout_graph
+REPORT_SCRIPT_POSITIONS = """;
+        var nodePositions = """
+
+REPORT_SCRIPT_CLOSE = """;
         
         // Visualization setup
         var width = 1200, height = 800;
         var showLabels = true;
+        var force, label;
         
-        var svg = d3.select("#visualization")
-            .append("svg")
-            .attr("width", width)
-            .attr("height", height)
-            .call(d3.behavior.zoom().on("zoom", function () {{
-                svg.attr("transform", "translate(" + d3.event.translate + ")" + " scale(" + d3.event.scale + ")");
-            }}))
-            .append("g");
+        // d3 loads with defer, so the tables render without waiting for it;
+        // the graph is drawn once the document has been parsed
+        document.addEventListener("DOMContentLoaded", function() {
+            var svg = d3.select("#visualization")
+                .append("svg")
+                .attr("width", width)
+                .attr("height", height)
+                .call(d3.zoom().on("zoom", function (event) {
+                    svg.attr("transform", event.transform);
+                }))
+                .append("g");
         
-        // Create nodes from links
-        var nodes = {{}};
-        graphData.forEach(function(link) {{
-            link.source = nodes[link.source] || (nodes[link.source] = {{name: link.source}});
-            link.target = nodes[link.target] || (nodes[link.target] = {{name: link.target}});
-        }});
+            // Create nodes from links, placed where the report generator laid them out
+            var nodes = {};
+            var precomputed = Object.keys(nodePositions).length > 0;
+            function graphNode(name) {
+                var position = nodePositions[name];
+                return nodes[name] || (nodes[name] = position ? {name: name, x: position[0], y: position[1]} : {name: name});
+            }
+            graphData.forEach(function(link) {
+                link.source = graphNode(link.source);
+                link.target = graphNode(link.target);
+            });
         
-        // Force layout with better spacing
-        var force = d3.layout.force()
-            .charge(-800)
-            .linkDistance(function(d) {{
-                // Different distances for different link types
-                if (d.color === "#2E8B57") return 80;  // Sentence-Subject
-                if (d.color === "#4169E1") return 60;  // Subject-Phenomena  
-                if (d.color === "#FF6347") return 100; // Phenomena-Wiki
-                return 80;
-            }})
-            .size([width, height])
-            .nodes(d3.values(nodes))
-            .links(graphData)
-            .start();
+            // Force layout with better spacing; many-body repulsion uses a
+            // Barnes-Hut quadtree, so each tick is O(n log n) rather than O(n^2)
+            force = d3.forceSimulation(Object.values(nodes))
+                .force("charge", d3.forceManyBody().strength(-800).theta(0.9))
+                .force("link", d3.forceLink(graphData).distance(function(d) {
+                    // Different distances for different link types
+                    if (d.color === "#2E8B57") return 80;  // Sentence-Subject
+                    if (d.color === "#4169E1") return 60;  // Subject-Phenomena  
+                    if (d.color === "#FF6347") return 100; // Phenomena-Wiki
+                    return 80;
+                }))
+                // Gentle pull towards the middle, like the old layout's gravity
+                .force("x", d3.forceX(width / 2).strength(0.1))
+                .force("y", d3.forceY(height / 2).strength(0.1))
+                // Settle in about 130 ticks, then stop using CPU
+                .alphaDecay(0.05)
+                // A precomputed layout is drawn once without simulating;
+                // dragging or Restart Simulation starts the live layout
+                .alpha(precomputed ? 0 : 1);
         
-        // Links
-        var link = svg.selectAll(".link")
-            .data(graphData)
-            .enter().append("line")
-            .attr("class", "link")
-            .style("stroke", function(d) {{ return d.color; }});
+            // Links
+            var link = svg.selectAll(".link")
+                .data(graphData)
+                .enter().append("line")
+                .attr("class", "link")
+                .style("stroke", function(d) { return d.color; });
         
-        // Nodes with different sizes and colors by type
-        var node = svg.selectAll(".node")
-            .data(force.nodes())
-            .enter().append("circle")
-            .attr("class", "node")
-            .attr("r", function(d) {{
-                if (d.name.startsWith("S")) return 12;      // Sentences - largest
-                if (d.name.startsWith("SUBJ:")) return 10;  // Subjects - medium
-                if (d.name.startsWith("PHEN:")) return 8;   // Phenomena - small
-                if (d.name.startsWith("WIKI:")) return 6;   // Wikipedia - smallest
-                return 8;
-            }})
-            .style("fill", function(d) {{
-                if (d.name.startsWith("S")) return "#FF4500";      // Orange for sentences
-                if (d.name.startsWith("SUBJ:")) return "#32CD32";  // Lime green for subjects
-                if (d.name.startsWith("PHEN:")) return "#4169E1";  // Royal blue for phenomena
-                if (d.name.startsWith("WIKI:")) return "#FF1493";  // Deep pink for wikipedia
-                return "#666";
-            }})
-            .call(force.drag);
+            // Nodes with different sizes and colors by type
+            var node = svg.selectAll(".node")
+                .data(force.nodes())
+                .enter().append("circle")
+                .attr("class", "node")
+                .attr("r", function(d) {
+                    if (d.name.startsWith("S")) return 12;      // Sentences - largest
+                    if (d.name.startsWith("SUBJ:")) return 10;  // Subjects - medium
+                    if (d.name.startsWith("PHEN:")) return 8;   // Phenomena - small
+                    if (d.name.startsWith("WIKI:")) return 6;   // Wikipedia - smallest
+                    return 8;
+                })
+                .style("fill", function(d) {
+                    if (d.name.startsWith("S")) return "#FF4500";      // Orange for sentences
+                    if (d.name.startsWith("SUBJ:")) return "#32CD32";  // Lime green for subjects
+                    if (d.name.startsWith("PHEN:")) return "#4169E1";  // Royal blue for phenomena
+                    if (d.name.startsWith("WIKI:")) return "#FF1493";  // Deep pink for wikipedia
+                    return "#666";
+                })
+                .call(d3.drag()
+                    .on("start", function(event, d) {
+                        if (!event.active) force.alphaTarget(0.3).restart();
+                        d.fx = d.x;
+                        d.fy = d.y;
+                    })
+                    .on("drag", function(event, d) {
+                        d.fx = event.x;
+                        d.fy = event.y;
+                    })
+                    .on("end", function(event, d) {
+                        if (!event.active) force.alphaTarget(0);
+                        d.fx = null;
+                        d.fy = null;
+                    }));
         
-        // Labels
-        var label = svg.selectAll(".label")
-            .data(force.nodes())
-            .enter().append("text")
-            .attr("class", "label")
-            .text(function(d) {{ return d.name.length > 30 ? d.name.substring(0, 30) + "..." : d.name; }})
-            .style("font-size", "10px")
-            .style("fill", "#333");
+            // Labels
+            label = svg.selectAll(".label")
+                .data(force.nodes())
+                .enter().append("text")
+                .attr("class", "label")
+                .text(function(d) { return d.name.length > 30 ? d.name.substring(0, 30) + "..." : d.name; })
+                .style("font-size", "10px")
+                .style("fill", "#333");
         
-        // Update positions
-        force.on("tick", function() {{
-            link.attr("x1", function(d) {{ return d.source.x; }})
-                .attr("y1", function(d) {{ return d.source.y; }})
-                .attr("x2", function(d) {{ return d.target.x; }})
-                .attr("y2", function(d) {{ return d.target.y; }});
+            // Update positions
+            force.on("tick", function() {
+                link.attr("x1", function(d) { return d.source.x; })
+                    .attr("y1", function(d) { return d.source.y; })
+                    .attr("x2", function(d) { return d.target.x; })
+                    .attr("y2", function(d) { return d.target.y; });
             
-            node.attr("cx", function(d) {{ return d.x; }})
-                .attr("cy", function(d) {{ return d.y; }});
+                node.attr("cx", function(d) { return d.x; })
+                    .attr("cy", function(d) { return d.y; });
             
-            label.attr("x", function(d) {{ return d.x + 10; }})
-                 .attr("y", function(d) {{ return d.y + 3; }});
-        }});
+                label.attr("x", function(d) { return d.x + 10; })
+                     .attr("y", function(d) { return d.y + 3; });
+            });
+        });
         
         // Control functions
-        function restartSimulation() {{
-            force.start();
-        }}
+        function restartSimulation() {
+            if (force) force.alpha(1).restart();
+        }
         
-        function toggleLabels() {{
+        function toggleLabels() {
             showLabels = !showLabels;
-            label.style("display", showLabels ? "block" : "none");
-        }}
+            if (label) label.style("display", showLabels ? "block" : "none");
+        }
     </script>
 </body>
 </html>"""
+
+def generate_html_report(json_file, output_file="index.html"):
+    """Generate self-contained HTML report with D3.js visualization"""
     
-    # Write HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
+    # The file is parsed once and shared with the project planner
+    data = read_json(Path(json_file).read_bytes())
+    write_html_report(data, output_file)
     print(f"HTML report generated: {output_file}")
     
     # Generate project plan at the end of processing
     try:
-        from src.project_planner import generate_project_plan
-        plan_results = generate_project_plan(str(json_file), str(Path(output_file).parent))
+        from .project_planner import generate_project_plan
+        plan_results = generate_project_plan(str(json_file), str(Path(output_file).parent), data=data)
         print(f"📊 Project plan: {plan_results['csv']}")
         print(f"🌐 Interactive Gantt: {plan_results['html']}")
     except Exception as e:
         print(f"Project plan generation failed: {e}")
 
+def write_html_report(data, output_file):
+    """Render the HTML report for one parsed extraction JSON document"""
+    
+    # Extract data from the nested structure
+    source_data = data.get('_source', {})
+    sentences = source_data.get('sentences', [])
+    subjects = source_data.get('subjects', [])
+    phen = source_data.get('phen', [])
+    wiki_data = source_data.get('wiki', [])
+    
+    # Build graph links with better connectivity
+    links = []
+    nodes_set = set()
+    
+    # Lowercase everything once instead of inside the matching loops
+    subjects_lower = [subj.lower() for subj in subjects]
+    subject_words = [subj.split() for subj in subjects_lower]
+    phen_lower = [p.lower() for p in phen]
+    match_subjects = build_phrase_matcher(subjects_lower)
+    
+    # Build each node name once and reuse the same string object everywhere
+    subject_nodes = [f"SUBJ: {subj}" for subj in subjects]
+    phen_nodes = [f"PHEN: {p}" for p in phen]
+    # Phenomena related to a subject don't depend on the sentence; find them once per subject
+    related_phen_nodes = {}
+    
+    # Create hierarchical structure: Sentences -> Subjects -> Phenomena -> Wikipedia
+    for i, sentence in enumerate(sentences):
+        sentence_node = f"S{i}: {sentence['sentence'][:40]}..."
+        nodes_set.add(sentence_node)
+        
+        # Link sentences to their subjects
+        sentence_subjects = match_subjects(sentence['sentence'].lower())
+        for j in sentence_subjects[:3]:  # Limit to 3 subjects per sentence
+            subj_node = subject_nodes[j]
+            nodes_set.add(subj_node)
+            links.append({
+                "source": sentence_node,
+                "target": subj_node,
+                "color": "#2E8B57"  # Sea green for sentence-subject links
+            })
+            
+            # Link subjects to related phenomena
+            if j not in related_phen_nodes:
+                words = subject_words[j]
+                related_phen_nodes[j] = [phen_nodes[k] for k, p_lower in enumerate(phen_lower) if any(word in p_lower for word in words)][:2]
+            for phen_node in related_phen_nodes[j]:  # Limit to 2 phenomena per subject
+                nodes_set.add(phen_node)
+                links.append({
+                    "source": subj_node,
+                    "target": phen_node,
+                    "color": "#4169E1"  # Royal blue for subject-phenomena links
+                })
+    
+    # Link phenomena to Wikipedia entries
+    for i, wiki in enumerate(wiki_data):
+        wiki_concept = wiki.get('wiki_search_content', '')
+        wiki_node = f"WIKI: {wiki_concept}"
+        nodes_set.add(wiki_node)
+        
+        # Find matching phenomena for this wiki entry
+        wiki_lower = wiki_concept.lower()
+        matching_phen = [phen_nodes[k] for k, p_lower in enumerate(phen_lower) if wiki_lower in p_lower or p_lower in wiki_lower]
+        for phen_node in matching_phen[:1]:  # One wiki per phenomenon
+            if phen_node in nodes_set:
+                links.append({
+                    "source": phen_node,
+                    "target": wiki_node,
+                    "color": "#FF6347"  # Tomato red for phenomena-wiki links
+                })
+    
+    # Convert to a compact JSON string for embedding
+    links_json = json.dumps(links, separators=(',', ':'))
+    
+    phen_pattern = compile_phenomena_pattern(phen)
+    
+    # Write the report section by section, formatting each card and row as it is written
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(REPORT_HEADER)
+        for subj in subjects:
+            f.write(f'<div style="background: #e6f3ff; padding: 8px; border-radius: 4px; border-left: 3px solid #0066cc;"><span class="phenomenon">{subj}</span></div>')
+        
+        f.write(PHENOMENA_SECTION)
+        for concept in phen:
+            f.write(f'<div style="background: #f0f8e6; padding: 8px; border-radius: 4px; border-left: 3px solid #66cc00;"><span>{concept}</span></div>')
+        
+        f.write(WIKI_CANDIDATES_SECTION)
+        for candidate in source_data.get("wiki_blues", []):
+            f.write(f'<div style="background: #fff0f5; padding: 8px; border-radius: 4px; border-left: 3px solid #ff69b4;"><span>{candidate}</span></div>')
+        
+        f.write(SENTENCES_SECTION)
+        row_fields = ((s["sentence"], s.get("warm_vector", [0,0,0]), s.get("cold_vector", [0,0,0])) for s in sentences)
+        if len(sentences) > PARALLEL_ROWS_MIN_SENTENCES and (os.cpu_count() or 1) > 1:
+            # Large tables: render rows across processes, written back in order
+            with ProcessPoolExecutor(initializer=init_row_worker, initargs=(phen_pattern,)) as executor:
+                f.writelines(executor.map(render_row_in_worker, row_fields, chunksize=256))
+        else:
+            for fields in row_fields:
+                f.write(render_sentence_row(fields, phen_pattern))
+        
+        f.write(WIKI_ENRICHMENT_SECTION)
+        for w in wiki_data:
+            f.write(f'<tr><td>{w.get("wiki_search_content", "")}</td><td>{w.get("wiki_summary", "")[:200]}...</td><td><a href="{w.get("wiki_url", "")}" target="_blank">{w.get("wiki_url", "").split("/")[-1].replace("_", " ")}</a></td></tr>')
+        
+        f.write(REPORT_SCRIPT_OPEN)
+        f.write(links_json)
+        f.write(REPORT_SCRIPT_POSITIONS)
+        f.write(json.dumps(layout_graph(links), separators=(',', ':')))
+        f.write(REPORT_SCRIPT_CLOSE)
+
+def layout_graph(links, width=1200, height=800, iterations=100, max_nodes=500):
+    """
+    Lay out the link graph with Fruchterman-Reingold in NumPy, so the page
+    can draw the network straight away instead of simulating it on every
+    load. Returns {node name: [x, y]} scaled into a width x height canvas.
+    The starting positions are seeded, so the same links give the same layout.
+    Graphs above max_nodes return {} and are left to the browser's D3
+    simulation: the all-pairs repulsion grows quadratically in time and
+    memory, and past a few hundred nodes it costs more than it saves.
+    """
+    names = list(dict.fromkeys(name for link in links for name in (link["source"], link["target"])))
+    if not names or len(names) > max_nodes:
+        return {}
+    
+    index = {name: i for i, name in enumerate(names)}
+    sources = np.array([index[link["source"]] for link in links])
+    targets = np.array([index[link["target"]] for link in links])
+    
+    # Work in the unit square; k is the ideal distance between nodes
+    count = len(names)
+    k = 1 / np.sqrt(count)
+    pos = np.random.default_rng(0).random((count, 2))
+    
+    for step in range(iterations):
+        # All-pairs repulsion k^2/d along each pair's direction
+        dx = pos[:, 0, None] - pos[:, 0]
+        dy = pos[:, 1, None] - pos[:, 1]
+        weight = k * k / np.maximum(dx * dx + dy * dy, 1e-4)
+        disp = np.column_stack(((dx * weight).sum(axis=1), (dy * weight).sum(axis=1)))
+        
+        # Attraction d^2/k along each link
+        edge = pos[sources] - pos[targets]
+        pull = edge * (np.hypot(edge[:, 0], edge[:, 1]) / k)[:, None]
+        np.subtract.at(disp, sources, pull)
+        np.add.at(disp, targets, pull)
+        
+        # A weak pull to the centre keeps disconnected pieces together
+        disp -= (pos - pos.mean(axis=0)) * (0.2 * count * k)
+        
+        # Move at most the current temperature, cooling linearly
+        temperature = 0.1 * (1 - step / iterations)
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-9)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+    
+    # Fit the layout into the canvas, keeping its proportions
+    margin = 40
+    low, high = pos.min(axis=0), pos.max(axis=0)
+    scale = min((width - 2 * margin) / max(high[0] - low[0], 1e-9),
+                (height - 2 * margin) / max(high[1] - low[1], 1e-9))
+    pos = (pos - (low + high) / 2) * scale + [width / 2, height / 2]
+    
+    return {name: [round(x, 1), round(y, 1)] for name, (x, y) in zip(names, pos.tolist())}
+
+# Sentence tables longer than this are rendered in worker processes
+PARALLEL_ROWS_MIN_SENTENCES = 2000
+
+def render_sentence_row(fields, phen_pattern):
+    """One sentences-table row from (sentence, warm_vector, cold_vector)"""
+    sentence, warm_vector, cold_vector = fields
+    return f'<tr><td>{highlight_phenomena(sentence, phen_pattern)}</td><td>{format_vector(warm_vector, "warm")}</td><td>{format_vector(cold_vector, "cold")}</td></tr>'
+
+# Phenomena pattern for rows rendered in a worker process, set once per worker
+_worker_phen_pattern = None
+
+def init_row_worker(phen_pattern):
+    """ProcessPoolExecutor initializer: receive the phenomena pattern once"""
+    global _worker_phen_pattern
+    _worker_phen_pattern = phen_pattern
+
+def render_row_in_worker(fields):
+    """render_sentence_row with the worker's phenomena pattern"""
+    return render_sentence_row(fields, _worker_phen_pattern)
+
+# Highlight spans for vectors with any weight, by vector type
+VECTOR_SPANS = {
+    "warm": '<span style="background-color: #ffcccc;">%s</span>',
+    "cold": '<span style="background-color: #ccddff;">%s</span>',
+}
+
 def format_vector(vector, vector_type=""):
     """Format vector values to 2 decimal places with conditional highlighting"""
     if not vector or vector == "N/A":
         return "N/A"
     
-    formatted = f"[{', '.join(f'{v:.2f}' if v is not None else '0.00' for v in vector)}]"
-    vector_sum = sum(v for v in vector if v is not None)
+    if len(vector) == 3:
+        # Sentence vectors are always three values; unrolled, None counts as zero
+        a, b, c = vector
+        a = 0.0 if a is None else a
+        b = 0.0 if b is None else b
+        c = 0.0 if c is None else c
+        formatted = f"[{a:.2f}, {b:.2f}, {c:.2f}]"
+        vector_sum = a + b + c
+    else:
+        formatted = f"[{', '.join(f'{v:.2f}' if v is not None else '0.00' for v in vector)}]"
+        vector_sum = sum(v for v in vector if v is not None)
     
-    if vector_sum > 0.009:
-        if vector_type == "warm":
-            return f'<span style="background-color: #ffcccc;">{formatted}</span>'
-        elif vector_type == "cold":
-            return f'<span style="background-color: #ccddff;">{formatted}</span>'
+    span = VECTOR_SPANS.get(vector_type)
+    if span and vector_sum > 0.009:
+        return span % formatted
     
     return formatted
 
-def highlight_phenomena(text, phenomena):
-    """Highlight phenomena in text with blue color"""
+def compile_phenomena_pattern(phenomena):
+    """
+    Build a single regex that matches any phenomenon, preferring the longest
+    one at each position. The alternatives are nested as a character trie so
+    the regex engine follows one branch per character instead of trying every
+    phenomenon in turn. Returns None when there is nothing to highlight.
+    """
+    trie = {}
     for phen in phenomena:
-        if phen in text:
-            text = text.replace(phen, f'<span class="phenomenon">{phen}</span>')
-    return text
+        if phen:
+            node = trie
+            for char in phen:
+                node = node.setdefault(char, {})
+            node[''] = True
+    
+    def trie_to_regex(node):
+        branches = [re.escape(char) + trie_to_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A phenomenon ends here, so the longer continuations are optional
+        return f"(?:{body})?" if '' in node else body
+    
+    return re.compile(trie_to_regex(trie)) if trie else None
+
+def highlight_phenomena(text, pattern):
+    """Highlight phenomena in text with blue color in one pass over the text"""
+    if pattern is None:
+        return text
+    return pattern.sub(lambda match: f'<span class="phenomenon">{match.group(0)}</span>', text)
 
 def main():
     import argparse
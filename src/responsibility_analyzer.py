@@ -24,25 +24,95 @@ Processes LinguaLint JSON reports to calculate Responsibility Ratios (R = I/N)
 for entities mentioned in extracted event data.
 """
 
-import json
 import sys
+from bisect import bisect_right
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union
+from dataclasses import dataclass, field
+
+from .json_writer import read_json, write_json
+from .phrase_matcher import build_phrase_matcher
+
+# Intention weights: Positivity, Engagement, Optimism
+INTENTION_WEIGHTS = (0.4, 0.4, 0.2)
+# Negligence weights: Negativity, Risk, Uncertainty
+NEGLIGENCE_WEIGHTS = (0.5, 0.3, 0.2)
+
+def score_entities(avg_warm: np.ndarray, avg_cold: np.ndarray, counts: np.ndarray):
+    """
+    Intention, negligence and responsibility ratio for many entities at once.
+    
+    avg_warm and avg_cold are (entities, 3) per-mention vector averages and
+    counts the mention counts. Scores match calculate_intention_score and
+    calculate_negligence_score, including I=0 and N=1 for unmentioned entities.
+    """
+    # Unmentioned entities keep the defaults; only mentioned rows are scored
+    mentioned = counts > 0
+    intention = np.zeros(len(counts))
+    negligence = np.ones(len(counts))
+    warm = avg_warm[mentioned]
+    cold = avg_cold[mentioned]
+    
+    w0, w1, w2 = INTENTION_WEIGHTS
+    intention[mentioned] = np.maximum((warm[:, 0] * w0 + warm[:, 1] * w1 + warm[:, 2] * w2) * 100, 0.1)
+    w0, w1, w2 = NEGLIGENCE_WEIGHTS
+    negligence[mentioned] = np.maximum((cold[:, 0] * w0 + cold[:, 1] * w1 + cold[:, 2] * w2) * 100, 0.1)
+    
+    return intention, negligence, intention / negligence
+
+def round_scores(values: np.ndarray, ndigits: int = 3) -> List[Any]:
+    """
+    round(value, ndigits) for a whole array, as nested lists of floats.
+    
+    Values are scaled and rounded in one array pass; the few lying within
+    float error of a halfway point, where the scaled product may round the
+    other way, are rounded by round() itself so results match exactly.
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    with np.errstate(invalid='ignore'):
+        near_half = ~(np.abs(scaled - np.floor(scaled) - 0.5) > 1e-6) | ~(np.abs(scaled) < 1e9)
+    if near_half.any():
+        rounded[near_half] = [round(value, ndigits) for value in values[near_half].tolist()]
+    return rounded.tolist()
+
+# Ratio bucket upper bounds and labels for risk_levels (ratio > bound moves up a bucket)
+RISK_THRESHOLDS = np.array([1.0, 2.0, 5.0, 10.0])
+RISK_LABELS = np.array(["Very High", "High", "Moderate", "Low", "Very Low"])
+
+def risk_levels(responsibility_ratios: np.ndarray) -> List[str]:
+    """risk_level for a whole array of ratios, with one binary search each"""
+    buckets = np.searchsorted(RISK_THRESHOLDS, responsibility_ratios, side='left')
+    # NaN compares false everywhere in the ladder, so it lands in the lowest bucket
+    buckets[np.isnan(responsibility_ratios)] = 0
+    return RISK_LABELS[buckets].tolist()
+
+def risk_level(responsibility_ratio: float) -> str:
+    """Risk assessment based on the responsibility ratio"""
+    if responsibility_ratio > 10:
+        return "Very Low"
+    elif responsibility_ratio > 5:
+        return "Low"
+    elif responsibility_ratio > 2:
+        return "Moderate"
+    elif responsibility_ratio > 1:
+        return "High"
+    else:
+        return "Very High"
 
 @dataclass
 class LinguaLintEntity:
     """Entity extracted from LinguaLint analysis"""
     name: str
     mention_count: int = 0
-    warm_vector_sum: List[float] = None
-    cold_vector_sum: List[float] = None
+    warm_vector_sum: np.ndarray = None
+    cold_vector_sum: np.ndarray = None
     
     def __post_init__(self):
-        if self.warm_vector_sum is None:
-            self.warm_vector_sum = [0.0, 0.0, 0.0]
-        if self.cold_vector_sum is None:
-            self.cold_vector_sum = [0.0, 0.0, 0.0]
+        self.warm_vector_sum = np.zeros(3) if self.warm_vector_sum is None else np.array(self.warm_vector_sum, dtype=np.float64)
+        self.cold_vector_sum = np.zeros(3) if self.cold_vector_sum is None else np.array(self.cold_vector_sum, dtype=np.float64)
 
 @dataclass
 class ResponsibilityEvent:
@@ -54,6 +124,67 @@ class ResponsibilityEvent:
     cold_vector: List[float]
     concepts: List[str]
 
+@dataclass
+class ResponsibilityEvents:
+    """
+    All events processed from LinguaLint sentence data, stored column-wise
+    
+    One list or array per field instead of one object per sentence; the
+    vectors are kept as float32, since scoring reads the float64 values
+    before they are stored and the reports round to 3 decimals. Entities
+    are integer ids into the entity_names table: those of event i are
+    entity_ids[entity_indptr[i]:entity_indptr[i + 1]]; the concepts of
+    event i are concept_names[concept_indptr[i]:concept_indptr[i + 1]].
+    Every event of a batch shares its source timestamp, so timestamps are
+    kept once per batch, starting at event batch_starts[b]. Indexing or
+    iterating yields ResponsibilityEvent views.
+    """
+    sentences: List[str] = field(default_factory=list)
+    timestamps: List[str] = field(default_factory=list)
+    batch_starts: List[int] = field(default_factory=list)
+    warm_vectors: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float32))
+    cold_vectors: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float32))
+    entity_indptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    entity_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    entity_names: List[str] = field(default_factory=list)
+    concept_indptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    concept_names: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.sentences)
+    
+    def __getitem__(self, i: int) -> ResponsibilityEvent:
+        entities = slice(*self.entity_indptr[i:i + 2].tolist())
+        concepts = slice(*self.concept_indptr[i:i + 2].tolist())
+        return ResponsibilityEvent(
+            sentence=self.sentences[i],
+            timestamp=self.timestamps[bisect_right(self.batch_starts, i) - 1],
+            entities=[self.entity_names[j] for j in self.entity_ids[entities].tolist()],
+            warm_vector=self.warm_vectors[i].tolist(),
+            cold_vector=self.cold_vectors[i].tolist(),
+            concepts=self.concept_names[concepts]
+        )
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+    
+    def extend(self, sentences: List[str], timestamp: str, warm_vectors: np.ndarray, cold_vectors: np.ndarray,
+               entity_counts: np.ndarray, entity_ids: np.ndarray,
+               concept_counts: np.ndarray, concept_names: List[str]) -> None:
+        """
+        Append a batch of events; counts give each event's number of entities
+        and concepts. Entity ids index entity_names, which the caller maintains
+        """
+        self.batch_starts.append(len(self.sentences))
+        self.timestamps.append(timestamp)
+        self.sentences.extend(sentences)
+        self.warm_vectors = np.concatenate([self.warm_vectors, np.asarray(warm_vectors, dtype=np.float32)])
+        self.cold_vectors = np.concatenate([self.cold_vectors, np.asarray(cold_vectors, dtype=np.float32)])
+        self.entity_indptr = np.concatenate([self.entity_indptr, self.entity_indptr[-1] + np.cumsum(entity_counts, dtype=np.int64)])
+        self.entity_ids = np.concatenate([self.entity_ids, np.asarray(entity_ids, dtype=np.int32)])
+        self.concept_indptr = np.concatenate([self.concept_indptr, self.concept_indptr[-1] + np.cumsum(concept_counts, dtype=np.int64)])
+        self.concept_names.extend(concept_names)
+
 class LinguaLintResponsibilityEngine:
     """
     Responsibility Futures Engine integrated with LinguaLint Event Code Extractor
@@ -63,13 +194,33 @@ class LinguaLintResponsibilityEngine:
     """
     
     def __init__(self):
-        self.entities: Dict[str, LinguaLintEntity] = {}
-        self.events: List[ResponsibilityEvent] = []
+        # Entity statistics are parallel arrays indexed by entity id; names
+        # map to ids once per extraction and are otherwise only for output
+        self.entity_names: List[str] = []
+        self.entity_ids: Dict[str, int] = {}
+        self.mention_counts = np.zeros(0, dtype=np.int64)
+        self.warm_sums = np.zeros((0, 3))
+        self.cold_sums = np.zeros((0, 3))
+        self.events = ResponsibilityEvents(entity_names=self.entity_names)
+    
+    @property
+    def entities(self) -> Dict[str, LinguaLintEntity]:
+        """Snapshot of the entity statistics by name"""
+        return {name: self.entity(i) for i, name in enumerate(self.entity_names)}
+    
+    def entity(self, entity_id: int) -> LinguaLintEntity:
+        """Snapshot of one entity's statistics"""
+        return LinguaLintEntity(
+            name=self.entity_names[entity_id],
+            mention_count=int(self.mention_counts[entity_id]),
+            warm_vector_sum=self.warm_sums[entity_id],
+            cold_vector_sum=self.cold_sums[entity_id]
+        )
     
     def load_lingualint_report(self, json_file_path: str) -> Dict[str, Any]:
         """Load and parse LinguaLint JSON report"""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(json_file_path, 'rb') as f:
+            return read_json(f.read())
     
     def extract_entities_and_events(self, lingualint_data: Dict[str, Any]) -> None:
         """Extract entities and events from LinguaLint data structure"""
@@ -79,41 +230,66 @@ class LinguaLintResponsibilityEngine:
         concepts = source.get('phen', [])  # phenomena as concepts
         timestamp = source.get('@timestamp', datetime.now().isoformat())
         
-        # Initialize entities from subjects
+        # Initialize entities from subjects and map each subject to its id
         for subject in subjects:
-            if subject not in self.entities:
-                self.entities[subject] = LinguaLintEntity(name=subject)
+            if subject not in self.entity_ids:
+                self.entity_ids[subject] = len(self.entity_names)
+                self.entity_names.append(subject)
+        new_entities = len(self.entity_names) - len(self.mention_counts)
+        self.mention_counts = np.concatenate([self.mention_counts, np.zeros(new_entities, dtype=np.int64)])
+        self.warm_sums = np.concatenate([self.warm_sums, np.zeros((new_entities, 3))])
+        self.cold_sums = np.concatenate([self.cold_sums, np.zeros((new_entities, 3))])
+        subject_ids = np.array([self.entity_ids[subject] for subject in subjects], dtype=np.int32)
+        
+        # Lowercase every sentence once; subjects and concepts are each found
+        # with one multi-phrase matcher instead of a substring test per phrase
+        lower_sentences = [sentence_data.get('sentence', '').lower() for sentence_data in sentences]
+        match_subjects = build_phrase_matcher([subject.lower() for subject in subjects])
+        match_concepts = build_phrase_matcher([concept.lower() for concept in concepts])
+        
+        # Boolean (sentences x subjects) mention matrix and (sentences x 3) vectors;
+        # missing vector values count as zero
+        mentions = np.zeros((len(sentences), len(subjects)), dtype=bool)
+        for row, sentence in enumerate(lower_sentences):
+            mentions[row, match_subjects(sentence)] = True
+        warm = np.array([s.get('warm_vector', [0.0, 0.0, 0.0]) for s in sentences], dtype=np.float64).reshape(-1, 3)
+        cold = np.array([s.get('cold_vector', [0.0, 0.0, 0.0]) for s in sentences], dtype=np.float64).reshape(-1, 3)
+        warm[np.isnan(warm)] = 0.0
+        cold[np.isnan(cold)] = 0.0
         
-        # Process sentences as events
-        for sentence_data in sentences:
-            sentence = sentence_data.get('sentence', '')
-            warm_vector = sentence_data.get('warm_vector', [0.0, 0.0, 0.0])
-            cold_vector = sentence_data.get('cold_vector', [0.0, 0.0, 0.0])
-            
-            # Find entities mentioned in this sentence
-            mentioned_entities = [
-                entity for entity in subjects 
-                if entity.lower() in sentence.lower()
-            ]
-            
-            # Update entity statistics
-            for entity_name in mentioned_entities:
-                entity = self.entities[entity_name]
-                entity.mention_count += 1
-                for i in range(3):
-                    entity.warm_vector_sum[i] += warm_vector[i]
-                    entity.cold_vector_sum[i] += cold_vector[i]
-            
-            # Create event
-            event = ResponsibilityEvent(
-                sentence=sentence,
-                timestamp=timestamp,
-                entities=mentioned_entities,
-                warm_vector=warm_vector,
-                cold_vector=cold_vector,
-                concepts=[c for c in concepts if c.lower() in sentence.lower()]
-            )
-            self.events.append(event)
+        # Update entity statistics for every subject at once (a repeated subject
+        # counts once per listing, as before). bincount over the (sentence, subject)
+        # mention pairs sums each subject's sentences in order, without a dense
+        # float copy of the mention matrix
+        event_rows, subject_columns = np.nonzero(mentions)
+        subject_count = len(subjects)
+        mention_counts = np.bincount(subject_columns, minlength=subject_count)
+        warm_sums = np.column_stack([
+            np.bincount(subject_columns, weights=warm[event_rows, i], minlength=subject_count)
+            for i in range(3)
+        ])
+        cold_sums = np.column_stack([
+            np.bincount(subject_columns, weights=cold[event_rows, i], minlength=subject_count)
+            for i in range(3)
+        ])
+        # add.at applies a repeated subject's listings one after another
+        np.add.at(self.mention_counts, subject_ids, mention_counts)
+        np.add.at(self.warm_sums, subject_ids, warm_sums)
+        np.add.at(self.cold_sums, subject_ids, cold_sums)
+        
+        # Record the sentences as events, column by column; each event's
+        # entities are its mention matrix row, in subject order
+        concept_hits = [match_concepts(sentence) for sentence in lower_sentences]
+        self.events.extend(
+            sentences=[sentence_data.get('sentence', '') for sentence_data in sentences],
+            timestamp=timestamp,
+            warm_vectors=warm,
+            cold_vectors=cold,
+            entity_counts=mentions.sum(axis=1),
+            entity_ids=subject_ids[subject_columns],
+            concept_counts=[len(hits) for hits in concept_hits],
+            concept_names=[concepts[k] for hits in concept_hits for k in hits]
+        )
     
     def calculate_intention_score(self, entity: LinguaLintEntity) -> float:
         """
@@ -126,10 +302,12 @@ class LinguaLintResponsibilityEngine:
             return 0.0
         
         # Average warm vector across all mentions
-        avg_warm = [w / entity.mention_count for w in entity.warm_vector_sum]
+        avg_warm = (entity.warm_vector_sum / entity.mention_count).tolist()
         
-        # Weighted sum: Positivity(0.4) + Engagement(0.4) + Optimism(0.2)
-        intention_score = (avg_warm[0] * 0.4 + avg_warm[1] * 0.4 + avg_warm[2] * 0.2) * 100
+        # Weighted sum: Positivity(0.4) + Engagement(0.4) + Optimism(0.2);
+        # three terms are cheaper as scalar math than as np.dot
+        w0, w1, w2 = INTENTION_WEIGHTS
+        intention_score = (avg_warm[0] * w0 + avg_warm[1] * w1 + avg_warm[2] * w2) * 100
         
         return max(intention_score, 0.1)  # Minimum floor to avoid zero
     
@@ -144,10 +322,11 @@ class LinguaLintResponsibilityEngine:
             return 1.0
         
         # Average cold vector across all mentions
-        avg_cold = [c / entity.mention_count for c in entity.cold_vector_sum]
+        avg_cold = (entity.cold_vector_sum / entity.mention_count).tolist()
         
         # Weighted sum: Negativity(0.5) + Risk(0.3) + Uncertainty(0.2)
-        negligence_score = (avg_cold[0] * 0.5 + avg_cold[1] * 0.3 + avg_cold[2] * 0.2) * 100
+        w0, w1, w2 = NEGLIGENCE_WEIGHTS
+        negligence_score = (avg_cold[0] * w0 + avg_cold[1] * w1 + avg_cold[2] * w2) * 100
         
         return max(negligence_score, 0.1)  # Minimum floor to avoid zero
     
@@ -157,70 +336,88 @@ class LinguaLintResponsibilityEngine:
         
         Returns comprehensive responsibility assessment
         """
-        if entity_name not in self.entities:
+        if entity_name not in self.entity_ids:
             return {"error": f"Entity '{entity_name}' not found"}
         
-        entity = self.entities[entity_name]
+        entity = self.entity(self.entity_ids[entity_name])
         intention = self.calculate_intention_score(entity)
         negligence = self.calculate_negligence_score(entity)
         
         responsibility_ratio = intention / negligence
         
-        # Risk assessment based on ratio
-        if responsibility_ratio > 10:
-            risk_level = "Very Low"
-        elif responsibility_ratio > 5:
-            risk_level = "Low"
-        elif responsibility_ratio > 2:
-            risk_level = "Moderate"
-        elif responsibility_ratio > 1:
-            risk_level = "High"
-        else:
-            risk_level = "Very High"
-        
         return {
             "entity": entity_name,
             "mentions": entity.mention_count,
             "intention_score": round(intention, 3),
             "negligence_score": round(negligence, 3),
             "responsibility_ratio": round(responsibility_ratio, 3),
-            "risk_level": risk_level,
-            "avg_warm_vector": [round(w / entity.mention_count, 3) for w in entity.warm_vector_sum],
-            "avg_cold_vector": [round(c / entity.mention_count, 3) for c in entity.cold_vector_sum]
+            "risk_level": risk_level(responsibility_ratio),
+            "avg_warm_vector": [round(w, 3) for w in (entity.warm_vector_sum / max(entity.mention_count, 1)).tolist()],
+            "avg_cold_vector": [round(c, 3) for c in (entity.cold_vector_sum / max(entity.mention_count, 1)).tolist()]
         }
     
     def generate_responsibility_report(self) -> Dict[str, Any]:
         """Generate comprehensive responsibility report for all entities"""
         report = {
             "timestamp": datetime.now().isoformat(),
-            "total_entities": len(self.entities),
+            "total_entities": len(self.entity_names),
             "total_events": len(self.events),
             "entity_assessments": []
         }
         
-        # Calculate responsibility ratios for all entities
-        for entity_name in self.entities:
-            assessment = self.calculate_responsibility_ratio(entity_name)
-            if "error" not in assessment:
-                report["entity_assessments"].append(assessment)
+        # Calculate responsibility ratios for all entities in one array sweep
+        counts = self.mention_counts
+        warm_sums = self.warm_sums
+        cold_sums = self.cold_sums
         
-        # Sort by responsibility ratio (highest first)
-        report["entity_assessments"].sort(
-            key=lambda x: x["responsibility_ratio"], 
-            reverse=True
-        )
+        # Average once; the same averages feed the scores and the report.
+        # Unmentioned entities average to zero vectors
+        mention_counts = counts.tolist()
+        per_mention = np.maximum(counts, 1)[:, None]
+        avg_warm = warm_sums / per_mention
+        avg_cold = cold_sums / per_mention
+        intention, negligence, ratio = score_entities(avg_warm, avg_cold, counts)
+        
+        # Round every reported figure in one pass per array
+        intention_scores = round_scores(intention)
+        negligence_scores = round_scores(negligence)
+        responsibility_ratios = round_scores(ratio)
+        entity_risks = risk_levels(ratio)
+        avg_warm_vectors = round_scores(avg_warm)
+        avg_cold_vectors = round_scores(avg_cold)
+        
+        # Sort by responsibility ratio (highest first); the stable sort keeps
+        # entities with equal ratios in order, like list.sort(reverse=True)
+        order = np.argsort(-np.array(responsibility_ratios, dtype=np.float64), kind='stable').tolist()
+        report["entity_assessments"] = [
+            {
+                "entity": self.entity_names[i],
+                "mentions": mention_counts[i],
+                "intention_score": intention_scores[i],
+                "negligence_score": negligence_scores[i],
+                "responsibility_ratio": responsibility_ratios[i],
+                "risk_level": entity_risks[i],
+                "avg_warm_vector": avg_warm_vectors[i],
+                "avg_cold_vector": avg_cold_vectors[i]
+            }
+            for i in order
+        ]
         
         return report
 
-def analyze_responsibility(json_file_path: str) -> Dict[str, Any]:
+def analyze_responsibility(lingualint_report: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Main function to analyze responsibility from LinguaLint JSON file
+    Main function to analyze responsibility from a LinguaLint JSON file path,
+    or from an already-loaded LinguaLint result (skips the JSON round trip)
     Returns the responsibility analysis report
     """
     engine = LinguaLintResponsibilityEngine()
     
     # Load and process LinguaLint report
-    lingualint_data = engine.load_lingualint_report(json_file_path)
+    if isinstance(lingualint_report, dict):
+        lingualint_data = lingualint_report
+    else:
+        lingualint_data = engine.load_lingualint_report(lingualint_report)
     engine.extract_entities_and_events(lingualint_data)
     
     # Generate responsibility report
@@ -231,7 +428,7 @@ def analyze_responsibility(json_file_path: str) -> Dict[str, Any]:
 def main():
     """Main execution function"""
     if len(sys.argv) != 2:
-        print("Usage: python responsibility_analyzer.py <lingualint_report.json>")
+        print("Usage: python -m src.responsibility_analyzer <lingualint_report.json>")
         sys.exit(1)
     
     json_file = sys.argv[1]
@@ -260,8 +457,7 @@ def main():
         
         # Save detailed report
         output_file = json_file.replace('.json', '_responsibility_analysis.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(output_file, report)
         
         print(f"\nDetailed report saved to: {output_file}")
         return report
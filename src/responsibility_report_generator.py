@@ -24,12 +24,18 @@ for Responsibility Futures Analysis integrated with LinguaLint
 Generates enriched visual reports from responsibility analysis JSON data.
 """
 
-import json
-import sys
 import os
+import sys
+import colorsys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .json_writer import read_json
 
 # Try to import visualization libraries, but make them optional
 try:
@@ -37,14 +43,126 @@ try:
     matplotlib.use('Agg')  # Use non-interactive backend for PNG generation
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
+    from matplotlib.lines import Line2D
     import seaborn as sns
-    import pandas as pd
-    import numpy as np
     plt.ioff()  # Turn off interactive mode
     VISUALIZATION_AVAILABLE = True
 except ImportError:
     VISUALIZATION_AVAILABLE = False
-    print("Warning: Visualization libraries not available. Install matplotlib, seaborn, pandas, numpy for full functionality.")
+    print("Warning: Visualization libraries not available. Install matplotlib and seaborn for full functionality.")
+
+# One row of the top entities table in the HTML report
+ENTITY_ROW_TEMPLATE = """
+                        <tr>
+                            <td><strong>{rank}</strong></td>
+                            <td>{entity}</td>
+                            <td><strong>{responsibility_ratio:.2f}</strong></td>
+                            <td><span class="risk-badge risk-{risk_class}">{risk_level}</span></td>
+                            <td>{mentions}</td>
+                            <td>{intention_score:.2f}</td>
+                            <td>{negligence_score:.2f}</td>
+                        </tr>
+"""
+
+# Plots are laid out by the constrained layout engine when drawn, so saving
+# needs no extra tight-bbox render pass
+PLOT_DPI = 150
+
+# Pillow options for saved plots: zlib level 1 encodes several times faster
+# than the default level 6 for slightly larger files
+PNG_SAVE_OPTIONS = {'compress_level': 1}
+
+# Plot file formats; SVG skips rasterizing and PNG encoding and stays sharp
+# in the HTML report, PNG is the default since other tools pick up the PNGs
+PLOT_FORMATS = ('png', 'svg')
+
+@lru_cache(maxsize=8)
+def load_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parsed analysis JSON, shared by generators of an unchanged file; treat as read-only"""
+    with open(path, 'rb') as f:
+        return read_json(f.read())
+
+# Risk levels from lowest to highest risk; they are coded 0-4 in this order
+RISK_LEVELS = ['Very Low', 'Low', 'Moderate', 'High', 'Very High']
+
+def assessment_columns(assessments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    The plotted assessment fields as one array per field, in report order.
+    Risk levels are categorical: risk_code indexes risk_categories, which is
+    RISK_LEVELS followed by any other levels in order of first appearance.
+    """
+    categories = {level: code for code, level in enumerate(RISK_LEVELS)}
+    for a in assessments:
+        categories.setdefault(a['risk_level'], len(categories))
+    return {
+        'entity': np.array([a['entity'] for a in assessments], dtype=object),
+        'risk_level': np.array([a['risk_level'] for a in assessments], dtype=object),
+        'risk_code': np.array([categories[a['risk_level']] for a in assessments], dtype=np.int8),
+        'risk_categories': list(categories),
+        'mentions': np.array([a['mentions'] for a in assessments], dtype=np.int64),
+        'intention_score': np.array([a['intention_score'] for a in assessments], dtype=np.float64),
+        'negligence_score': np.array([a['negligence_score'] for a in assessments], dtype=np.float64),
+        'responsibility_ratio': np.array([a['responsibility_ratio'] for a in assessments], dtype=np.float64)
+    }
+
+def summary_statistics(columns: Dict[str, 'np.ndarray']) -> Dict[str, Any]:
+    """Ratio mean and median and high/low risk counts, all zero without assessments"""
+    if not len(columns['responsibility_ratio']):
+        return {'mean': 0, 'median': 0, 'high_risk': 0, 'low_risk': 0}
+    
+    ratios = columns['responsibility_ratio']
+    level_counts = np.bincount(columns['risk_code'], minlength=len(RISK_LEVELS)).tolist()
+    return {
+        'mean': ratios.mean(),
+        'median': np.median(ratios),
+        'high_risk': level_counts[3] + level_counts[4],
+        'low_risk': level_counts[0] + level_counts[1]
+    }
+
+def count_categories(codes: 'np.ndarray', categories: List[str]):
+    """Categories present in codes and their counts, most frequent first; ties keep first-seen order"""
+    counts = np.bincount(codes, minlength=len(categories))
+    first_seen = np.full(len(categories), len(codes))
+    np.minimum.at(first_seen, codes, np.arange(len(codes)))
+    present = np.flatnonzero(counts)
+    present = present[np.argsort(first_seen[present])]
+    order = present[np.argsort(-counts[present], kind='stable')]
+    return [categories[code] for code in order.tolist()], counts[order]
+
+def pearson_correlation(x: 'np.ndarray', y: 'np.ndarray') -> float:
+    """Pearson correlation, NaN when either side is constant or too short"""
+    if len(x) < 2:
+        return float('nan')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return float(np.corrcoef(x, y)[0, 1])
+
+def draw_heatmap(ax, values: 'np.ndarray', row_labels: List[str], column_labels: List[str], cmap: str) -> None:
+    """
+    Annotated heatmap drawn directly with imshow, in the look of
+    seaborn.heatmap(annot=True, fmt='.3f') without its per-call setup
+    """
+    image = ax.imshow(values, cmap=cmap, aspect='auto', interpolation='nearest')
+    colorbar = ax.figure.colorbar(image, ax=ax)
+    colorbar.outline.set_visible(False)
+    ax.set_xticks(range(len(column_labels)), column_labels)
+    ax.set_yticks(range(len(row_labels)), row_labels)
+    ax.tick_params(length=0)
+    ax.grid(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    
+    # Dark cells get white text, light cells black, by relative luminance as seaborn does
+    rgb = image.cmap(image.norm(values))[..., :3]
+    rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    dark = rgb @ np.array([0.2126, 0.7152, 0.0722]) <= 0.408
+    for (row, column), text in np.ndenumerate(np.char.mod('%.3f', values)):
+        ax.text(column, row, text, ha='center', va='center', color='white' if dark[row, column] else 'black')
+
+@lru_cache(maxsize=None)
+def use_plot_style() -> None:
+    """Apply the plot style sheet and palette, once per process"""
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
 
 class ResponsibilityReportGenerator:
     """
@@ -52,21 +170,53 @@ class ResponsibilityReportGenerator:
     from responsibility analysis JSON data
     """
     
-    def __init__(self, json_file_path: str):
+    def __init__(self, json_file_path: str, plot_format: str = 'png'):
+        if plot_format not in PLOT_FORMATS:
+            raise ValueError(f"Unsupported plot format '{plot_format}', expected one of {', '.join(PLOT_FORMATS)}")
         self.json_file_path = json_file_path
+        self.plot_format = plot_format
         self.data = self.load_data()
+        self.columns = assessment_columns(self.data.get('entity_assessments', []))
+        self.stats = summary_statistics(self.columns)
         self.output_dir = Path(json_file_path).parent
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # One figure is redrawn for every plot instead of a new one each time
+        self._fig = None
+        
         # Set up matplotlib style if available
         if VISUALIZATION_AVAILABLE:
-            plt.style.use('seaborn-v0_8')
-            sns.set_palette("husl")
+            use_plot_style()
+    
+    def _figure(self, figsize) -> 'matplotlib.figure.Figure':
+        """The shared plot figure, cleared and resized for the next plot"""
+        if self._fig is None:
+            self._fig = plt.figure(layout='constrained')
+        else:
+            self._fig.clear()
+        self._fig.set_size_inches(figsize)
+        return self._fig
+    
+    def close(self) -> None:
+        """Release the shared plot figure"""
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = None
+    
+    def _save_plot(self, fig, name: str) -> str:
+        """Save the figure as name_<timestamp> in the plot format; returns the filename"""
+        filename = f"{name}_{self.timestamp}.{self.plot_format}"
+        if self.plot_format == 'png':
+            fig.savefig(self.output_dir / filename, dpi=PLOT_DPI, pil_kwargs=PNG_SAVE_OPTIONS)
+        else:
+            fig.savefig(self.output_dir / filename)
+        return filename
     
     def load_data(self) -> Dict[str, Any]:
         """Load responsibility analysis JSON data"""
-        with open(self.json_file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Keyed by modification time and size, so an edited file is read again
+        stat = os.stat(self.json_file_path)
+        return load_json(os.path.abspath(self.json_file_path), stat.st_mtime_ns, stat.st_size)
     
     def create_responsibility_matrix_plot(self) -> Optional[str]:
         """
@@ -81,10 +231,11 @@ class ResponsibilityReportGenerator:
             return None
         
         # Prepare data for visualization
-        df = pd.DataFrame(assessments)
+        columns = self.columns
         
         # Create figure with subplots
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = self._figure((16, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         fig.suptitle('Responsibility Futures Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. Responsibility Ratio vs Risk Level (Scatter Plot)
@@ -96,67 +247,60 @@ class ResponsibilityReportGenerator:
             'Very High': '#DC143C'    # Crimson
         }
         
-        for risk_level in risk_colors:
-            mask = df['risk_level'] == risk_level
-            if mask.any():
-                ax1.scatter(df[mask]['intention_score'], df[mask]['negligence_score'], 
-                           c=risk_colors[risk_level], label=risk_level, alpha=0.7, s=60)
+        # One scatter for all risk levels, drawn level by level so higher risk
+        # points stay on top; entities with an unknown level are not plotted
+        codes = columns['risk_code']
+        plotted = np.flatnonzero(codes < len(RISK_LEVELS))
+        plotted = plotted[np.argsort(codes[plotted], kind='stable')]
+        point_colors = [risk_colors[level] for level in columns['risk_level'][plotted].tolist()]
+        ax1.scatter(columns['intention_score'][plotted], columns['negligence_score'][plotted], 
+                   c=point_colors, alpha=0.7, s=60)
         
         ax1.set_xlabel('Intention Score')
         ax1.set_ylabel('Negligence Score')
         ax1.set_title('Risk Assessment Matrix')
-        ax1.legend()
+        ax1.legend(handles=[
+            Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(60), markeredgecolor='none',
+                   color=risk_colors[risk_level], alpha=0.7, label=risk_level)
+            for code, risk_level in enumerate(RISK_LEVELS) if (codes == code).any()
+        ])
         ax1.grid(True, alpha=0.3)
         
-        # Add diagonal lines for R ratios
-        x_range = np.linspace(0, df['intention_score'].max() * 1.1, 100)
-        for r_val in [1, 2, 5, 10]:
-            y_range = x_range / r_val
-            ax1.plot(x_range, y_range, '--', alpha=0.5, label=f'R={r_val}')
-        
         # 2. Top 15 Entities by Responsibility Ratio (Horizontal Bar Chart)
-        top_entities = df.nlargest(15, 'responsibility_ratio')
-        bars = ax2.barh(range(len(top_entities)), top_entities['responsibility_ratio'])
+        # Stable descending order keeps tied entities in report order, like nlargest
+        top_entities = np.argsort(-columns['responsibility_ratio'], kind='stable')[:15]
+        bar_colors = [risk_colors.get(level, '#808080') for level in columns['risk_level'][top_entities].tolist()]
+        ax2.barh(range(len(top_entities)), columns['responsibility_ratio'][top_entities],
+                 color=bar_colors, edgecolor=bar_colors)
         ax2.set_yticks(range(len(top_entities)))
         ax2.set_yticklabels([name[:25] + '...' if len(name) > 25 else name 
-                            for name in top_entities['entity']], fontsize=8)
+                            for name in columns['entity'][top_entities].tolist()], fontsize=8)
         ax2.set_xlabel('Responsibility Ratio (R = I/N)')
         ax2.set_title('Top 15 Entities by Responsibility Ratio')
         ax2.grid(True, alpha=0.3, axis='x')
         
-        # Color bars by risk level
-        for i, (_, row) in enumerate(top_entities.iterrows()):
-            bars[i].set_color(risk_colors.get(row['risk_level'], '#808080'))
-        
         # 3. Risk Level Distribution (Pie Chart)
-        risk_counts = df['risk_level'].value_counts()
-        colors = [risk_colors.get(level, '#808080') for level in risk_counts.index]
-        wedges, texts, autotexts = ax3.pie(risk_counts.values, labels=risk_counts.index, 
+        risk_labels, risk_counts = count_categories(columns['risk_code'], columns['risk_categories'])
+        colors = [risk_colors.get(level, '#808080') for level in risk_labels]
+        wedges, texts, autotexts = ax3.pie(risk_counts, labels=risk_labels, 
                                           autopct='%1.1f%%', colors=colors, startangle=90)
         ax3.set_title('Risk Level Distribution')
         
         # 4. Mention Count vs Responsibility Ratio (Bubble Chart)
-        scatter = ax4.scatter(df['mentions'], df['responsibility_ratio'], 
-                             s=df['intention_score']*2, alpha=0.6, 
-                             c=df['negligence_score'], cmap='RdYlBu_r')
+        scatter = ax4.scatter(columns['mentions'], columns['responsibility_ratio'], 
+                             s=columns['intention_score']*2, alpha=0.6, 
+                             c=columns['negligence_score'], cmap='RdYlBu_r')
         ax4.set_xlabel('Number of Mentions')
         ax4.set_ylabel('Responsibility Ratio')
         ax4.set_title('Entity Visibility vs Responsibility\\n(Bubble size = Intention Score)')
         ax4.grid(True, alpha=0.3)
         
         # Add colorbar for negligence score
-        cbar = plt.colorbar(scatter, ax=ax4)
+        cbar = fig.colorbar(scatter, ax=ax4)
         cbar.set_label('Negligence Score')
         
-        plt.tight_layout()
-        
         # Save the plot
-        filename = f"responsibility_matrix_{self.timestamp}.png"
-        filepath = self.output_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        return self._save_plot(fig, 'responsibility_matrix')
     
     def create_vector_analysis_plot(self) -> Optional[str]:
         """
@@ -181,34 +325,24 @@ class ResponsibilityReportGenerator:
             cold_vectors.append(assessment['avg_cold_vector'])
         
         # Create figure
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig = self._figure((16, 8))
+        (ax1, ax2) = fig.subplots(1, 2)
         fig.suptitle('Warm/Cold Vector Analysis - Top 20 Entities', fontsize=14, fontweight='bold')
         
         # Warm vectors heatmap
-        warm_df = pd.DataFrame(warm_vectors, 
-                              columns=['Positivity', 'Engagement', 'Optimism'],
-                              index=entities)
-        sns.heatmap(warm_df, annot=True, fmt='.3f', cmap='Reds', ax=ax1)
+        draw_heatmap(ax1, np.array(warm_vectors, dtype=np.float64).reshape(-1, 3), entities,
+                     ['Positivity', 'Engagement', 'Optimism'], 'Reds')
         ax1.set_title('Warm Vectors (Intention Indicators)')
         ax1.set_ylabel('Entities')
         
         # Cold vectors heatmap
-        cold_df = pd.DataFrame(cold_vectors,
-                              columns=['Negativity', 'Risk', 'Uncertainty'], 
-                              index=entities)
-        sns.heatmap(cold_df, annot=True, fmt='.3f', cmap='Blues', ax=ax2)
+        draw_heatmap(ax2, np.array(cold_vectors, dtype=np.float64).reshape(-1, 3), entities,
+                     ['Negativity', 'Risk', 'Uncertainty'], 'Blues')
         ax2.set_title('Cold Vectors (Negligence Indicators)')
         ax2.set_ylabel('')
         
-        plt.tight_layout()
-        
         # Save the plot
-        filename = f"vector_analysis_{self.timestamp}.png"
-        filepath = self.output_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        return self._save_plot(fig, 'vector_analysis')
     
     def create_statistical_summary_plot(self) -> Optional[str]:
         """
@@ -222,17 +356,19 @@ class ResponsibilityReportGenerator:
         if not assessments:
             return None
         
-        df = pd.DataFrame(assessments)
+        columns = self.columns
+        ratios = columns['responsibility_ratio']
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig = self._figure((14, 10))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         fig.suptitle('Statistical Analysis Summary', fontsize=14, fontweight='bold')
         
         # 1. Responsibility Ratio Distribution
-        ax1.hist(df['responsibility_ratio'], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-        ax1.axvline(df['responsibility_ratio'].mean(), color='red', linestyle='--', 
-                   label=f'Mean: {df["responsibility_ratio"].mean():.2f}')
-        ax1.axvline(df['responsibility_ratio'].median(), color='green', linestyle='--',
-                   label=f'Median: {df["responsibility_ratio"].median():.2f}')
+        ax1.hist(ratios, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
+        ax1.axvline(self.stats['mean'], color='red', linestyle='--', 
+                   label=f'Mean: {self.stats["mean"]:.2f}')
+        ax1.axvline(self.stats['median'], color='green', linestyle='--',
+                   label=f'Median: {self.stats["median"]:.2f}')
         ax1.set_xlabel('Responsibility Ratio')
         ax1.set_ylabel('Frequency')
         ax1.set_title('Distribution of Responsibility Ratios')
@@ -240,46 +376,63 @@ class ResponsibilityReportGenerator:
         ax1.grid(True, alpha=0.3)
         
         # 2. Intention vs Negligence Correlation
-        ax2.scatter(df['intention_score'], df['negligence_score'], alpha=0.6)
+        ax2.scatter(columns['intention_score'], columns['negligence_score'], alpha=0.6)
         ax2.set_xlabel('Intention Score')
         ax2.set_ylabel('Negligence Score')
         ax2.set_title('Intention vs Negligence Correlation')
         
         # Add correlation coefficient
-        corr = df['intention_score'].corr(df['negligence_score'])
+        corr = pearson_correlation(columns['intention_score'], columns['negligence_score'])
         ax2.text(0.05, 0.95, f'Correlation: {corr:.3f}', transform=ax2.transAxes,
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         ax2.grid(True, alpha=0.3)
         
         # 3. Mentions Distribution
-        ax3.hist(df['mentions'], bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
+        ax3.hist(columns['mentions'], bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
         ax3.set_xlabel('Number of Mentions')
         ax3.set_ylabel('Frequency')
         ax3.set_title('Entity Mention Distribution')
         ax3.grid(True, alpha=0.3)
         
-        # 4. Box plot of scores by risk level
+        # 4. Box plot of scores by risk level, one box per (level, score type)
+        # drawn with bxp from per-group statistics, styled like seaborn's boxplot
         risk_order = ['Very High', 'High', 'Moderate', 'Low', 'Very Low']
-        df_melted = pd.melt(df, id_vars=['risk_level'], 
-                           value_vars=['intention_score', 'negligence_score'],
-                           var_name='Score Type', value_name='Score')
-        
-        sns.boxplot(data=df_melted, x='risk_level', y='Score', hue='Score Type', ax=ax4,
-                   order=risk_order)
+        score_types = ['intention_score', 'negligence_score']
+        box_colors = [sns.desaturate(color, 0.75) for color in sns.color_palette(n_colors=len(score_types))]
+        line_lightness = min(colorsys.rgb_to_hls(*color)[1] for color in box_colors) * 0.6
+        line_color = (line_lightness, line_lightness, line_lightness)
+        level_groups = [
+            (position, columns['risk_code'] == RISK_LEVELS.index(level))
+            for position, level in enumerate(risk_order)
+        ]
+        level_groups = [(position, mask) for position, mask in level_groups if mask.any()]
+        for offset, score_type, color in zip((-0.2, 0.2), score_types, box_colors):
+            scores = columns[score_type]
+            ax4.bxp(
+                matplotlib.cbook.boxplot_stats([scores[mask] for _, mask in level_groups]),
+                positions=[position + offset for position, _ in level_groups],
+                widths=0.4, capwidths=0.2, patch_artist=True, manage_ticks=False,
+                boxprops={'facecolor': color, 'edgecolor': line_color},
+                medianprops={'color': line_color, 'solid_capstyle': 'butt'},
+                whiskerprops={'color': line_color, 'solid_capstyle': 'butt'},
+                capprops={'color': line_color},
+                flierprops={'markeredgecolor': line_color,
+                            'markersize': matplotlib.rcParams['lines.markersize']}
+            )
+        ax4.set_xticks(range(len(risk_order)), risk_order)
+        ax4.set_xlim(-0.5, len(risk_order) - 0.5)
+        ax4.xaxis.grid(False)
+        ax4.legend(handles=[
+            patches.Patch(facecolor=color, edgecolor=line_color, label=score_type)
+            for score_type, color in zip(score_types, box_colors)
+        ], title='Score Type')
         ax4.set_xlabel('Risk Level')
         ax4.set_ylabel('Score')
         ax4.set_title('Score Distribution by Risk Level')
         ax4.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        
         # Save the plot
-        filename = f"statistical_summary_{self.timestamp}.png"
-        filepath = self.output_dir / filename
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        return filename
+        return self._save_plot(fig, 'statistical_summary')
     
     def generate_html_report(self, matrix_plot: Optional[str], vector_plot: Optional[str], stats_plot: Optional[str]) -> str:
         """
@@ -291,15 +444,10 @@ class ResponsibilityReportGenerator:
         analysis_timestamp = self.data.get('timestamp', 'Unknown')
         
         # Calculate summary statistics
-        df = pd.DataFrame(assessments) if assessments and VISUALIZATION_AVAILABLE else None
-        
-        if df is not None and not df.empty:
-            avg_responsibility = df['responsibility_ratio'].mean()
-            median_responsibility = df['responsibility_ratio'].median()
-            high_risk_count = len(df[df['risk_level'].isin(['High', 'Very High'])])
-            low_risk_count = len(df[df['risk_level'].isin(['Low', 'Very Low'])])
-        else:
-            avg_responsibility = median_responsibility = high_risk_count = low_risk_count = 0
+        avg_responsibility = self.stats['mean']
+        median_responsibility = self.stats['median']
+        high_risk_count = self.stats['high_risk']
+        low_risk_count = self.stats['low_risk']
         
         # Generate visualization sections
         viz_sections = ""
@@ -584,19 +732,19 @@ class ResponsibilityReportGenerator:
 """
         
         # Add top 20 entities to the table
-        for i, assessment in enumerate(assessments[:20], 1):
-            risk_class = assessment['risk_level'].lower().replace(' ', '-')
-            html_content += f"""
-                        <tr>
-                            <td><strong>{i}</strong></td>
-                            <td>{assessment['entity']}</td>
-                            <td><strong>{assessment['responsibility_ratio']:.2f}</strong></td>
-                            <td><span class="risk-badge risk-{risk_class}">{assessment['risk_level']}</span></td>
-                            <td>{assessment['mentions']}</td>
-                            <td>{assessment['intention_score']:.2f}</td>
-                            <td>{assessment['negligence_score']:.2f}</td>
-                        </tr>
-"""
+        html_content += "".join(
+            ENTITY_ROW_TEMPLATE.format(
+                rank=i,
+                entity=assessment['entity'],
+                responsibility_ratio=assessment['responsibility_ratio'],
+                risk_class=assessment['risk_level'].lower().replace(' ', '-'),
+                risk_level=assessment['risk_level'],
+                mentions=assessment['mentions'],
+                intention_score=assessment['intention_score'],
+                negligence_score=assessment['negligence_score']
+            )
+            for i, assessment in enumerate(assessments[:20], 1)
+        )
         
         html_content += f"""
                     </tbody>
@@ -639,19 +787,35 @@ class ResponsibilityReportGenerator:
         
         return html_filename
     
-    def generate_all_reports(self) -> Dict[str, Optional[str]]:
+    def generate_all_reports(self, parallel: bool = False) -> Dict[str, Optional[str]]:
         """
         Generate all reports and visualizations
         Returns dictionary with filenames of generated files
         """
-        print("🎨 Generating responsibility matrix visualization...")
-        matrix_plot = self.create_responsibility_matrix_plot()
-        
-        print("🌡️ Generating vector analysis visualization...")
-        vector_plot = self.create_vector_analysis_plot()
-        
-        print("📈 Generating statistical summary...")
-        stats_plot = self.create_statistical_summary_plot()
+        # The plots are independent and CPU-bound, so a batch run with several
+        # cores can render each one in its own process from the same JSON
+        # file; this is opt-in, since starting the processes costs more than
+        # it saves for a single report and forking a threaded server is not
+        # safe. Without the plotting libraries only the HTML report is written
+        if not VISUALIZATION_AVAILABLE:
+            matrix_plot = vector_plot = stats_plot = None
+        elif parallel and (os.cpu_count() or 1) > 1:
+            print("🎨 Generating responsibility matrix, vector analysis and statistical summary visualizations...")
+            with ProcessPoolExecutor(max_workers=len(PLOT_METHODS)) as executor:
+                futures = [executor.submit(render_plot, self.json_file_path, self.plot_format, self.timestamp, method) for method in PLOT_METHODS]
+                matrix_plot, vector_plot, stats_plot = [future.result() for future in futures]
+        else:
+            try:
+                print("🎨 Generating responsibility matrix visualization...")
+                matrix_plot = self.create_responsibility_matrix_plot()
+                
+                print("🌡️ Generating vector analysis visualization...")
+                vector_plot = self.create_vector_analysis_plot()
+                
+                print("📈 Generating statistical summary...")
+                stats_plot = self.create_statistical_summary_plot()
+            finally:
+                self.close()
         
         print("📄 Generating HTML report...")
         html_report = self.generate_html_report(matrix_plot, vector_plot, stats_plot)
@@ -663,18 +827,31 @@ class ResponsibilityReportGenerator:
             'stats_plot': stats_plot
         }
 
-def generate_responsibility_reports(json_file_path: str) -> Dict[str, Optional[str]]:
+PLOT_METHODS = ('create_responsibility_matrix_plot', 'create_vector_analysis_plot', 'create_statistical_summary_plot')
+
+def render_plot(json_file_path: str, plot_format: str, timestamp: str, method: str) -> Optional[str]:
+    """Process pool worker: render one plot with a generator of its own"""
+    generator = ResponsibilityReportGenerator(json_file_path, plot_format)
+    generator.timestamp = timestamp
+    try:
+        return getattr(generator, method)()
+    finally:
+        generator.close()
+
+def generate_responsibility_reports(json_file_path: str, plot_format: str = 'png', parallel: bool = False) -> Dict[str, Optional[str]]:
     """
-    Main function to generate responsibility reports from JSON file
+    Main function to generate responsibility reports from JSON file;
+    plot_format is 'png' or 'svg', and parallel renders the plots in
+    separate processes
     """
-    generator = ResponsibilityReportGenerator(json_file_path)
-    return generator.generate_all_reports()
+    generator = ResponsibilityReportGenerator(json_file_path, plot_format)
+    return generator.generate_all_reports(parallel)
 
 def main():
     """Main execution function"""
     if len(sys.argv) != 2:
-        print("Usage: python responsibility_report_generator.py <responsibility_analysis.json>")
-        print("Example: python responsibility_report_generator.py extraction_20251230_082034_responsibility_analysis.json")
+        print("Usage: python -m src.responsibility_report_generator <responsibility_analysis.json>")
+        print("Example: python -m src.responsibility_report_generator extraction_20251230_082034_responsibility_analysis.json")
         sys.exit(1)
     
     json_file = sys.argv[1]
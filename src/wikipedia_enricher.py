@@ -20,41 +20,190 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 Wikipedia Integration for Modern NLP Processor
 Enriches extracted concepts with Wikipedia summaries
+
+Found summaries are cached in memory and in a SQLite file under the
+LinguaLint cache folder for WIKI_CACHE_TTL, so concepts that recur across
+documents and runs are only fetched once.
 """
 
-import wikipedia
+import time
+import sqlite3
+import requests
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
+from pathlib import Path
 from urllib.parse import quote
 
-def integrate_wikipedia_sync(nlp_result: Dict[str, Any]) -> Dict[str, Any]:
-    """Synchronous Wikipedia enrichment using wikipedia library"""
-    wiki_candidates = nlp_result['_source']['wiki_blues']
-    wiki_data = []
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+WIKI_USER_AGENT = "LinguaLint (https://github.com/jeffy893/lingualint)"
+
+# Concurrent searches; each one is a single network round-trip
+WIKI_FETCH_WORKERS = 10
+
+# Search hits considered per concept, so that a disambiguation page at the
+# top falls through to the first article below it
+WIKI_SEARCH_RESULTS = 5
+
+# Query parameters for the intro of each page and its disambiguation flag
+WIKI_EXTRACT_PARAMS = {
+    "action": "query",
+    "format": "json",
+    "prop": "extracts|pageprops",
+    "ppprop": "disambiguation",
+    "exintro": 1,
+    "explaintext": 1,
+    "exsentences": 2,
+    "exlimit": "max",
+    "redirects": 1
+}
+
+CACHE_DIR = Path(".lingualint_cache")
+WIKI_CACHE_FILE = CACHE_DIR / "wikipedia.sqlite"
+WIKI_CACHE_TTL = 30 * 24 * 3600  # seconds
+WIKI_MEMORY_CACHE_SIZE = 4096
+
+# Most recently used summaries of this process, by concept
+_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def _open_cache() -> sqlite3.Connection:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(WIKI_CACHE_FILE, timeout=10)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS summaries "
+        "(concept TEXT PRIMARY KEY, url TEXT, summary TEXT, fetched_at REAL)"
+    )
+    return connection
+
+def _remember(entry: Dict[str, Any]) -> None:
+    _memory_cache[entry["wiki_search_content"]] = entry
+    _memory_cache.move_to_end(entry["wiki_search_content"])
+    while len(_memory_cache) > WIKI_MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+def _cached_entries(concepts: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Cached summaries for the concepts that have one; a broken cache is a miss"""
+    found = {}
+    for concept in concepts:
+        if concept in _memory_cache:
+            _memory_cache.move_to_end(concept)
+            found[concept] = _memory_cache[concept]
     
-    for concept in wiki_candidates[:10]:  # Limit to 10 to avoid rate limits
+    missing = [concept for concept in dict.fromkeys(concepts) if concept not in found]
+    if missing:
         try:
-            # Search for the concept
-            search_results = wikipedia.search(concept, results=1)
-            if search_results:
-                page_title = search_results[0]
-                summary = wikipedia.summary(page_title, sentences=2)
-                wiki_data.append({
-                    "wiki_search_content": concept,
-                    "wiki_url": f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}",
-                    "wiki_summary": summary
-                })
-            else:
-                wiki_data.append({
-                    "wiki_search_content": concept,
-                    "wiki_url": f"https://en.wikipedia.org/wiki/{concept.replace(' ', '_')}",
-                    "wiki_summary": ""
-                })
-        except Exception:
-            wiki_data.append({
-                "wiki_search_content": concept,
-                "wiki_url": f"https://en.wikipedia.org/wiki/{concept.replace(' ', '_')}",
-                "wiki_summary": ""
-            })
+            with closing(_open_cache()) as connection:
+                rows = connection.execute(
+                    f"SELECT concept, url, summary FROM summaries "
+                    f"WHERE fetched_at > ? AND concept IN ({','.join('?' * len(missing))})",
+                    [time.time() - WIKI_CACHE_TTL, *missing]
+                ).fetchall()
+        except sqlite3.Error:
+            rows = []
+        for concept, url, summary in rows:
+            found[concept] = {"wiki_search_content": concept, "wiki_url": url, "wiki_summary": summary}
+            _remember(found[concept])
+    return found
+
+def _store_entries(entries: List[Dict[str, Any]]) -> None:
+    """Cache found summaries; empty results are retried on the next run"""
+    entries = [entry for entry in entries if entry["wiki_summary"]]
+    for entry in entries:
+        _remember(entry)
+    if not entries:
+        return
+    try:
+        with closing(_open_cache()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                [(entry["wiki_search_content"], entry["wiki_url"], entry["wiki_summary"], time.time()) for entry in entries]
+            )
+    except sqlite3.Error:
+        pass
+
+def _query(params: Dict[str, Any]) -> Dict[str, Any]:
+    """The query part of a MediaWiki API response, empty if the request fails"""
+    try:
+        response = requests.get(WIKI_API_URL, params={**WIKI_EXTRACT_PARAMS, **params},
+                                headers={"User-Agent": WIKI_USER_AGENT}, timeout=10)
+        response.raise_for_status()
+        return response.json().get("query", {})
+    except Exception:
+        return {}
+
+def _is_article(page: Dict[str, Any]) -> bool:
+    return ("missing" not in page and "invalid" not in page
+            and "disambiguation" not in page.get("pageprops", {}) and bool(page.get("extract")))
+
+def _entry(concept: str, page: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "wiki_search_content": concept,
+        "wiki_url": f"https://en.wikipedia.org/wiki/{page['title'].replace(' ', '_')}",
+        "wiki_summary": page["extract"]
+    }
+
+def _fetch_batch(concepts: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up concepts as page titles with one MediaWiki query, following
+    redirects. Returns entries for the concepts that resolve to an article;
+    disambiguation pages, missing pages and request failures are left out.
+    """
+    titles = [concept for concept in dict.fromkeys(concepts) if concept and '|' not in concept]
+    if not titles:
+        return {}
+    
+    query = _query({"titles": "|".join(titles)})
+    
+    # Titles are normalized (capitalization, underscores), then redirected
+    normalized = {entry["from"]: entry["to"] for entry in query.get("normalized", [])}
+    redirects = {entry["from"]: entry["to"] for entry in query.get("redirects", [])}
+    pages = {page["title"]: page for page in query.get("pages", {}).values() if _is_article(page)}
+    
+    wiki_data = {}
+    for concept in titles:
+        title = normalized.get(concept, concept)
+        page = pages.get(redirects.get(title, title))
+        if page is not None:
+            wiki_data[concept] = _entry(concept, page)
+    return wiki_data
+
+def _fetch_one(concept: str) -> Dict[str, Any]:
+    """
+    Look up one concept by full-text search: the highest ranked hit that is
+    an article, with its two-sentence summary. Hits and their disambiguation
+    flags arrive in the same response, so an ambiguous top hit costs no
+    extra request.
+    """
+    query = _query({"generator": "search", "gsrsearch": concept, "gsrlimit": WIKI_SEARCH_RESULTS})
+    hits = sorted(query.get("pages", {}).values(), key=lambda page: page.get("index", 0))
+    for page in hits:
+        if _is_article(page):
+            return _entry(concept, page)
+    
+    return {
+        "wiki_search_content": concept,
+        "wiki_url": f"https://en.wikipedia.org/wiki/{concept.replace(' ', '_')}",
+        "wiki_summary": ""
+    }
+
+def integrate_wikipedia_sync(nlp_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Synchronous Wikipedia enrichment using the MediaWiki API"""
+    wiki_candidates = nlp_result['_source']['wiki_blues'][:10]  # Limit to 10 to avoid rate limits
+    
+    # Cached concepts need no request. Of the rest, those that name an article
+    # are answered by one batched query; the others are searched individually,
+    # overlapping their network round-trips
+    found = _cached_entries(wiki_candidates)
+    fetched = _fetch_batch([concept for concept in wiki_candidates if concept not in found])
+    unresolved = [concept for concept in dict.fromkeys(wiki_candidates) if concept not in found and concept not in fetched]
+    if unresolved:
+        with ThreadPoolExecutor(max_workers=min(WIKI_FETCH_WORKERS, len(unresolved))) as executor:
+            fetched.update(zip(unresolved, executor.map(_fetch_one, unresolved)))
+    _store_entries(list(fetched.values()))
+    found.update(fetched)
+    # Copies, so a caller editing its results cannot change the cached entries
+    wiki_data = [dict(found[concept]) for concept in wiki_candidates]
     
     nlp_result['_source']['wiki'] = wiki_data
-    return nlp_result
\ No newline at end of file
+    return nlp_result
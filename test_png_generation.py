@@ -21,32 +21,69 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Test PNG generation in the responsibility analysis workflow
 """
 
+import os
+import sys
 import json
 from pathlib import Path
 from datetime import datetime
 
-# Test with existing responsibility analysis data
-# Look for the most recent analysis in lingualint_analysis folder
-analysis_base = Path("lingualint_analysis")
-test_file = None
+ANALYSIS_BASE = Path("lingualint_analysis")
+OLD_TEST_FILE = Path("reports/extraction_20260101_092551_responsibility_analysis.json")
 
-if analysis_base.exists():
-    # Find the most recent analysis folder
-    analysis_folders = [d for d in analysis_base.iterdir() if d.is_dir() and d.name.startswith("analysis_")]
-    if analysis_folders:
-        latest_folder = max(analysis_folders, key=lambda x: x.name)
-        # Look for responsibility analysis JSON
-        responsibility_files = list(latest_folder.glob("*_responsibility_analysis.json"))
-        if responsibility_files:
-            test_file = str(responsibility_files[0])
+def find_test_file():
+    """The responsibility analysis JSON of the most recent analysis, or None"""
+    if ANALYSIS_BASE.exists():
+        # Find the most recent analysis folder in one pass over the directory
+        latest_folder = None
+        with os.scandir(ANALYSIS_BASE) as entries:
+            for entry in entries:
+                if entry.name.startswith("analysis_") and entry.is_dir() and (latest_folder is None or entry.name > latest_folder.name):
+                    latest_folder = entry
+        if latest_folder is not None:
+            # Look for responsibility analysis JSON
+            with os.scandir(latest_folder.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith("_responsibility_analysis.json"):
+                        return entry.path
+    
+    # Fallback to old reports folder if nothing found in new structure
+    if OLD_TEST_FILE.exists():
+        return str(OLD_TEST_FILE)
+    return None
 
-# Fallback to old reports folder if nothing found in new structure
-if not test_file:
-    old_test_file = "reports/extraction_20260101_092551_responsibility_analysis.json"
-    if Path(old_test_file).exists():
-        test_file = old_test_file
+def responsibility_files(folder):
+    """Directory entries of the responsibility analysis JSON files in folder"""
+    with os.scandir(folder) as entries:
+        return [entry for entry in entries if entry.name.endswith("responsibility_analysis.json")]
 
-if test_file and Path(test_file).exists():
+def list_available_files():
+    print("Available files in lingualint_analysis:")
+    if ANALYSIS_BASE.exists():
+        with os.scandir(ANALYSIS_BASE) as analysis_folders:
+            for analysis_folder in analysis_folders:
+                if analysis_folder.is_dir():
+                    print(f"   📁 {analysis_folder.name}/")
+                    for f in responsibility_files(analysis_folder.path):
+                        print(f"      📄 {f.name}")
+    else:
+        print("   No lingualint_analysis folder found")
+    
+    print("Available files in reports folder:")
+    reports_folder = Path("reports")
+    if reports_folder.exists():
+        for f in responsibility_files(reports_folder):
+            print(f"   📄 {f.path}")
+    else:
+        print("   No reports folder found")
+
+def main():
+    """Test PNG generation with existing responsibility analysis data"""
+    test_file = find_test_file()
+    if test_file is None:
+        print(f"❌ Test file not found")
+        list_available_files()
+        return False
+    
     print(f"🧪 Testing PNG generation with: {test_file}")
     
     try:
@@ -59,42 +96,27 @@ if test_file and Path(test_file).exists():
         for file_type, filename in result.items():
             if filename:
                 file_path = Path(test_file).parent / filename
-                if file_path.exists():
-                    size = file_path.stat().st_size
+                try:
+                    size = os.stat(file_path).st_size
                     print(f"   ✅ {file_type}: {filename} ({size:,} bytes)")
-                else:
+                except FileNotFoundError:
                     print(f"   ❌ {file_type}: {filename} (FILE NOT FOUND)")
             else:
                 print(f"   ⚠️  {file_type}: None (not generated)")
         
         # Check if PNG files specifically exist
-        output_dir = Path(test_file).parent
-        png_files = list(output_dir.glob("*responsibility*.png"))
-        print(f"\n📈 Total PNG files found: {len(png_files)}")
-        for png_file in sorted(png_files):
-            print(f"   📊 {png_file.name}")
-            
+        with os.scandir(Path(test_file).parent) as entries:
+            png_names = sorted(entry.name for entry in entries if entry.name.endswith(".png") and "responsibility" in entry.name)
+        print(f"\n📈 Total PNG files found: {len(png_names)}")
+        for png_name in png_names:
+            print(f"   📊 {png_name}")
+        return True
+        
     except Exception as e:
         print(f"❌ Test failed: {e}")
         import traceback
         traceback.print_exc()
-        
-else:
-    print(f"❌ Test file not found")
-    print("Available files in lingualint_analysis:")
-    if analysis_base.exists():
-        for analysis_folder in analysis_base.iterdir():
-            if analysis_folder.is_dir():
-                print(f"   📁 {analysis_folder.name}/")
-                for f in analysis_folder.glob("*responsibility_analysis.json"):
-                    print(f"      📄 {f.name}")
-    else:
-        print("   No lingualint_analysis folder found")
-    
-    print("Available files in reports folder:")
-    reports_folder = Path("reports")
-    if reports_folder.exists():
-        for f in reports_folder.glob("*responsibility_analysis.json"):
-            print(f"   📄 {f}")
-    else:
-        print("   No reports folder found")
\ No newline at end of file
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -21,10 +21,15 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Test script to verify Responsibility Futures Analysis integration
 """
 
+import os
 import sys
-import json
+import time
+import pytest
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Runs NLP processing, both reports and the plots; select with pytest -m slow
+pytestmark = pytest.mark.slow
 
 # Test data
 TEST_TEXT = """
@@ -34,8 +39,11 @@ The board of directors has implemented new risk management protocols.
 Investors are concerned about potential losses from the economic downturn.
 """
 
-def test_integration():
-    """Test the complete integration workflow"""
+def run_integration(analysis_dir: Path, processor=None) -> bool:
+    """
+    Run the complete integration workflow, writing its files to analysis_dir;
+    an already initialized NLP processor can be passed in as processor
+    """
     print("🧪 Testing Responsibility Futures Analysis Integration")
     print("=" * 60)
     
@@ -46,11 +54,13 @@ def test_integration():
         from src.report_generator import generate_html_report
         from src.responsibility_analyzer import analyze_responsibility
         from src.responsibility_report_generator import generate_responsibility_reports
+        from src.json_writer import write_json
         print("✅ All modules imported successfully")
         
         # Initialize processor
         print("\nStep 2: Initializing NLP processor...")
-        processor = ModernNLPProcessor()
+        if processor is None:
+            processor = ModernNLPProcessor()
         print("✅ NLP processor initialized")
         
         # Process text
@@ -59,37 +69,28 @@ def test_integration():
         print("✅ Text processing completed")
         
         # Create output files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create lingualint_analysis directory structure
-        analysis_base_dir = Path("./lingualint_analysis")
-        analysis_base_dir.mkdir(exist_ok=True)
-        
-        # Create timestamped analysis folder
-        analysis_dir = analysis_base_dir / f"test_analysis_{timestamp}"
-        analysis_dir.mkdir(exist_ok=True)
-        
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         json_file = analysis_dir / f"test_extraction_{timestamp}.json"
         html_file = analysis_dir / f"test_report_{timestamp}.html"
         
         # Save JSON
         print("\nStep 4: Saving extraction results...")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        write_json(json_file, results)
         print(f"✅ JSON saved: {json_file}")
         
-        # Generate HTML report
+        # Generate HTML report and run the responsibility analysis; both only
+        # read the saved JSON, so they run side by side
         print("\nStep 5: Generating HTML report...")
-        generate_html_report(str(json_file), str(html_file))
-        print(f"✅ HTML report generated: {html_file}")
-        
-        # Test responsibility analysis
         print("\nStep 6: Running responsibility analysis...")
-        responsibility_report = analyze_responsibility(str(json_file))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            html_future = executor.submit(generate_html_report, str(json_file), str(html_file))
+            responsibility_future = executor.submit(analyze_responsibility, str(json_file))
+            html_future.result()
+            responsibility_report = responsibility_future.result()
+        print(f"✅ HTML report generated: {html_file}")
         
         responsibility_json = json_file.with_name(f"test_extraction_{timestamp}_responsibility_analysis.json")
-        with open(responsibility_json, 'w', encoding='utf-8') as f:
-            json.dump(responsibility_report, f, indent=2, ensure_ascii=False)
+        write_json(responsibility_json, responsibility_report)
         print(f"✅ Responsibility analysis completed: {responsibility_json}")
         
         # Generate responsibility reports
@@ -127,7 +128,7 @@ def test_integration():
     except ImportError as e:
         print(f"❌ Import error: {e}")
         print("💡 Make sure all dependencies are installed:")
-        print("   pip install spacy matplotlib seaborn pandas numpy")
+        print("   pip install spacy matplotlib seaborn numpy")
         print("   python -m spacy download en_core_web_sm")
         return False
         
@@ -137,6 +138,14 @@ def test_integration():
         traceback.print_exc()
         return False
 
+def test_integration(tmp_path, nlp_processor):
+    """Test the complete integration workflow in a temporary folder"""
+    assert run_integration(tmp_path, nlp_processor)
+
 if __name__ == "__main__":
-    success = test_integration()
+    # Keep the files of a manual run in a timestamped lingualint_analysis
+    # folder; the process id keeps runs started in the same second apart
+    analysis_dir = Path("./lingualint_analysis") / f"test_analysis_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    analysis_dir.mkdir(parents=True)
+    success = run_integration(analysis_dir)
     sys.exit(0 if success else 1)
\ No newline at end of file
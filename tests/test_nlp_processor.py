@@ -24,59 +24,62 @@ Test suite for LinguaLint NLP Processor
 import pytest
 import sys
 import os
+import subprocess
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.nlp_processor import ModernNLPProcessor
-
 class TestModernNLPProcessor:
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.processor = ModernNLPProcessor()
-        self.sample_text = """
+    sample_text = """
         The COVID-19 pandemic has materially adversely affected our business operations.
         Apple Inc. reported strong quarterly earnings despite market volatility.
         Interest rates may increase due to inflationary pressures.
         """
     
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _processor(cls, nlp_processor):
+        """Share the session's processor, and its spaCy pipeline, with the tests"""
+        cls.processor = nlp_processor
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_result(cls):
+        """The sample text processed once, shared by the tests that only inspect it"""
+        return cls.processor.process_text(cls.sample_text, enrich_wikipedia=False)
+    
     def test_processor_initialization(self):
         """Test that processor initializes correctly"""
         assert self.processor is not None
         assert self.processor.nlp is not None
         assert len(self.processor.semantic_primes) > 0
     
-    def test_process_text_basic(self):
+    def test_process_text_basic(self, sample_result):
         """Test basic text processing functionality"""
-        result = self.processor.process_text(self.sample_text, enrich_wikipedia=False)
-        
-        assert '_source' in result
-        assert 'sentences' in result['_source']
-        assert 'subjects' in result['_source']
-        assert 'phen' in result['_source']
-        assert len(result['_source']['sentences']) > 0
+        assert '_source' in sample_result
+        assert 'sentences' in sample_result['_source']
+        assert 'subjects' in sample_result['_source']
+        assert 'phen' in sample_result['_source']
+        assert len(sample_result['_source']['sentences']) > 0
     
-    def test_subject_extraction(self):
+    def test_subject_extraction(self, sample_result):
         """Test that subjects are properly extracted"""
-        result = self.processor.process_text(self.sample_text, enrich_wikipedia=False)
-        subjects = result['_source']['subjects']
+        subjects = sample_result['_source']['subjects']
         
         # Should extract proper nouns and organizations
         assert any('Apple' in subj for subj in subjects)
         assert any('COVID' in subj or 'pandemic' in subj for subj in subjects)
     
-    def test_phenomena_extraction(self):
+    def test_phenomena_extraction(self, sample_result):
         """Test that phenomena are extracted"""
-        result = self.processor.process_text(self.sample_text, enrich_wikipedia=False)
-        phen = result['_source']['phen']
+        phen = sample_result['_source']['phen']
         
         assert len(phen) > 0
         # Should contain both subjects and concepts
         assert any(item for item in phen if len(item) > 3)
     
-    def test_sentiment_vectors(self):
+    def test_sentiment_vectors(self, sample_result):
         """Test that sentiment vectors are calculated"""
-        result = self.processor.process_text(self.sample_text, enrich_wikipedia=False)
-        sentences = result['_source']['sentences']
+        sentences = sample_result['_source']['sentences']
         
         for sentence in sentences:
             assert 'warm_vector' in sentence
@@ -92,14 +95,32 @@ class TestModernNLPProcessor:
         assert len(result['_source']['sentences']) == 0
         assert len(result['_source']['subjects']) == 0
     
-    def test_wiki_candidates(self):
+    def test_process_texts_batch(self, sample_result):
+        """Test that batched processing matches processing each text alone"""
+        results = self.processor.process_texts([self.sample_text, ""], enrich_wikipedia=False)
+        
+        assert len(results) == 2
+        assert results[0]['_source']['sentences'] == sample_result['_source']['sentences']
+        assert sorted(results[0]['_source']['subjects']) == sorted(sample_result['_source']['subjects'])
+        assert len(results[1]['_source']['sentences']) == 0
+    
+    def test_wiki_candidates(self, sample_result):
         """Test Wikipedia candidate extraction"""
-        result = self.processor.process_text(self.sample_text, enrich_wikipedia=False)
-        wiki_blues = result['_source']['wiki_blues']
+        wiki_blues = sample_result['_source']['wiki_blues']
         
         assert len(wiki_blues) > 0
         # Should prioritize proper nouns and financial terms
         assert any('Apple' in candidate for candidate in wiki_blues)
 
+def test_no_plotting_imports():
+    """Test that importing the NLP processor does not load the plotting libraries"""
+    # A fresh interpreter, since other tests in the session may import them
+    code = ("import sys; import src.nlp_processor; "
+            "print(','.join(m for m in ('matplotlib', 'seaborn', 'pandas') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.join(os.path.dirname(__file__), '..'))
+    
+    assert result.stdout.strip() == ""
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file